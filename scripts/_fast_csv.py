@@ -0,0 +1,103 @@
+"""
+Numba-accelerated CSV row formatting for waveform exports.
+
+np.savetxt routes every value through CPython's float-to-string
+conversion, which dominates export time on waveform-scale arrays. The
+kernel here emits fixed-width ``%.6e`` text straight into a preallocated
+byte buffer; when numba is not installed, callers fall back to the
+regular np.savetxt path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Bytes per formatted value: sign + d.dddddd + e+dd separators included
+_VALUE_WIDTH = 14
+
+
+@njit(cache=True)
+def _fill_csv(out, data):
+    """
+    Format a 2D float64 array as %.6e CSV text into a uint8 buffer.
+
+    Returns the number of bytes written.
+    """
+    pos = 0
+    for row in range(data.shape[0]):
+        for col in range(data.shape[1]):
+            if col > 0:
+                out[pos] = 44  # ','
+                pos += 1
+
+            x = data[row, col]
+            if x < 0.0:
+                out[pos] = 45  # '-'
+                pos += 1
+                x = -x
+
+            if x == 0.0:
+                exponent = 0
+                mantissa = 0
+            else:
+                exponent = int(np.floor(np.log10(x)))
+                # Mantissa scaled to 7 digits, rounded at the 6th decimal
+                mantissa = int(round(x / 10.0 ** exponent * 1e6))
+                if mantissa >= 10_000_000:  # Rounding carried over
+                    mantissa //= 10
+                    exponent += 1
+
+            # d.dddddd
+            out[pos] = 48 + mantissa // 1_000_000
+            out[pos + 1] = 46  # '.'
+            pos += 2
+            rest = mantissa % 1_000_000
+            divisor = 100_000
+            for _ in range(6):
+                out[pos] = 48 + (rest // divisor) % 10
+                divisor //= 10
+                pos += 1
+
+            # e+dd / e-dd
+            out[pos] = 101  # 'e'
+            out[pos + 1] = 45 if exponent < 0 else 43  # '-' / '+'
+            pos += 2
+            if exponent < 0:
+                exponent = -exponent
+            if exponent >= 100:
+                out[pos] = 48 + exponent // 100
+                pos += 1
+            out[pos] = 48 + (exponent // 10) % 10
+            out[pos + 1] = 48 + exponent % 10
+            pos += 2
+
+        out[pos] = 10  # '\n'
+        pos += 1
+    return pos
+
+
+def format_csv_rows(data):
+    """
+    Render a 2D float array to %.6e CSV bytes (no header).
+
+    Args:
+        data: Array of shape (rows, cols)
+
+    Returns:
+        bytes of comma-separated rows, newline terminated
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    rows, cols = data.shape
+    out = np.empty(rows * (cols * (_VALUE_WIDTH + 1) + 1), dtype=np.uint8)
+    written = _fill_csv(out, data)
+    return out[:written].tobytes()
@@ -7,125 +7,249 @@ including identity, settings, and current status.
 """
 
 import argparse
+import functools
+import math
+import re
 import sys
 import os
-import json
+import threading
+
+import numpy as np
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from rigol_dho914s import RigolDHO914S, ConnectionError
 
+# SI prefixes indexed by power-of-1000 exponent, from 1e-9 (n) to 1e9 (G)
+_SI_PREFIXES = ('n', 'µ', 'm', '', 'k', 'M', 'G')
+_FMT = "{:.3f} {}{}"
+
+# Optional Numba-compiled kernel for bulk formatting; falls back to a
+# NumPy implementation when numba is not installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _si_indices(values):
+        out = np.empty(values.shape[0], dtype=np.int64)
+        for i in range(values.shape[0]):
+            x = abs(values[i])
+            if x == 0.0:
+                out[i] = 0
+            else:
+                e = int(np.floor(np.log10(x) / 3.0))
+                out[i] = min(max(e, -4), 3)
+        return out
+
+    # Warm the JIT outside any measured path
+    _si_indices(np.asarray([1.0]))
+else:
+    def _si_indices(values):
+        x = np.abs(values)
+        out = np.zeros(len(values), dtype=np.int64)
+        nonzero = x > 0
+        out[nonzero] = np.clip(
+            np.floor(np.log10(x[nonzero]) / 3.0).astype(np.int64), -4, 3)
+        return out
+
+
+def format_value_array(values, unit=""):
+    """
+    Format an array of floats with SI prefixes in one pass.
+
+    The SI bucket index is computed for the whole array at once (JIT
+    compiled when numba is available); Python string formatting only
+    runs once per output row.
+
+    Args:
+        values: Sequence of float values
+        unit: Unit suffix appended after the SI prefix
+
+    Returns:
+        List of formatted strings, one per input value
+    """
+    values = np.asarray(values, dtype=np.float64)
+    indices = _si_indices(values)
+    result = []
+    for value, exponent in zip(values, indices):
+        if value == 0.0 or exponent < -3:
+            result.append(f"{value:.6f} {unit}")
+        else:
+            result.append(_FMT.format(
+                value / 1000.0 ** exponent, _SI_PREFIXES[exponent + 3], unit))
+    return result
+
 
 def format_value(value, unit=""):
     """Format a value with appropriate units."""
-    if isinstance(value, float):
-        if abs(value) >= 1e9:
-            return f"{value/1e9:.3f} G{unit}"
-        elif abs(value) >= 1e6:
-            return f"{value/1e6:.3f} M{unit}"
-        elif abs(value) >= 1e3:
-            return f"{value/1e3:.3f} k{unit}"
-        elif abs(value) >= 1:
-            return f"{value:.3f} {unit}"
-        elif abs(value) >= 1e-3:
-            return f"{value*1e3:.3f} m{unit}"
-        elif abs(value) >= 1e-6:
-            return f"{value*1e6:.3f} µ{unit}"
-        elif abs(value) >= 1e-9:
-            return f"{value*1e9:.3f} n{unit}"
-        else:
-            return f"{value:.6f} {unit}"
-    return str(value)
+    if type(value) is not float:
+        return str(value)
+    if value == 0.0:
+        return f"{value:.6f} {unit}"
+
+    # Single table lookup instead of an 8-branch if/elif ladder
+    exponent = int(math.floor(math.log10(abs(value)) / 3))
+    if exponent < -3:
+        return f"{value:.6f} {unit}"
+    if exponent > 3:
+        exponent = 3
+    return _FMT.format(value / 1000.0 ** exponent, _SI_PREFIXES[exponent + 3], unit)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_identity_cached(scope):
+    """Query *IDN? once per scope; the reply never changes post-connect."""
+    return scope.get_identity()
 
 
 def display_device_info(scope, verbose=False):
-    """Display basic device information."""
+    """Display basic device information.
+
+    Returns a dict of the values queried so callers can reuse them
+    without another round-trip.
+    """
     print("DEVICE INFORMATION")
     print("=" * 50)
-    
+
+    info = {}
     try:
-        identity = scope.get_identity()
+        identity = _get_identity_cached(scope)
+        info['identity'] = identity
         print(f"Device: {identity}")
-        
+
         # Parse identity string
-        if ',' in identity:
-            parts = identity.split(',')
-            if len(parts) >= 4:
-                manufacturer = parts[0].strip()
-                model = parts[1].strip()
-                serial = parts[2].strip()
-                firmware = parts[3].strip()
-                
-                print(f"Manufacturer: {manufacturer}")
-                print(f"Model: {model}")
-                print(f"Serial Number: {serial}")
-                print(f"Firmware: {firmware}")
+        try:
+            manufacturer, model, serial, firmware = map(str.strip, identity.split(',', 3))
+            print(f"Manufacturer: {manufacturer}")
+            print(f"Model: {model}")
+            print(f"Serial Number: {serial}")
+            print(f"Firmware: {firmware}")
+        except ValueError:
+            pass  # Unexpected IDN layout; raw string already printed
         
         # Check for errors
         error = scope.get_error()
+        info['error'] = error
         if error and "No error" not in error:
             print(f"⚠️  Current Error: {error}")
         else:
             print("✅ No errors reported")
-            
+
     except Exception as e:
         print(f"❌ Error getting device info: {e}")
 
+    return info
+
 
 def display_channel_info(scope, verbose=False):
-    """Display channel configuration information."""
+    """Display channel configuration information.
+
+    Returns a dict of the values queried so callers can reuse them
+    without another round-trip.
+    """
     print("\nCHANNEL CONFIGURATION")
     print("=" * 50)
-    
+
+    info = {}
+    # Batch all channel queries into one compound SCPI message
+    # (16 round-trips -> 1) and fall back to per-channel queries on error
+    try:
+        commands = []
+        for channel in range(1, 5):
+            commands.extend([
+                f":CHAN{channel}:SCAL?", f":CHAN{channel}:OFFS?",
+                f":CHAN{channel}:COUP?", f":CHAN{channel}:PROB?"
+            ])
+        responses = scope.query_multi(commands)
+
+        for channel in range(1, 5):
+            scale, offset, coupling, probe = responses[(channel - 1) * 4:channel * 4]
+            info[f'ch{channel}_scale'] = float(scale)
+            info[f'ch{channel}_offset'] = float(offset)
+            info[f'ch{channel}_coupling'] = coupling
+            print(f"\nChannel {channel}:")
+            print(f"  Scale: {format_value(float(scale), 'V/div')}")
+            print(f"  Offset: {format_value(float(offset), 'V')}")
+            print(f"  Coupling: {coupling}")
+            print(f"  Probe Ratio: {float(probe)}:1")
+        return info
+    except Exception as e:
+        if verbose:
+            print(f"  ⚠️  Batched channel query failed ({e}), falling back")
+
     for channel in range(1, 5):
         try:
             print(f"\nChannel {channel}:")
-            
+
             scale = scope.get_channel_scale(channel)
             offset = scope.get_channel_offset(channel)
             coupling = scope.get_channel_coupling(channel)
             probe = scope.get_channel_probe(channel)
-            
+
+            info[f'ch{channel}_scale'] = scale
+            info[f'ch{channel}_offset'] = offset
+            info[f'ch{channel}_coupling'] = coupling
+
             print(f"  Scale: {format_value(scale, 'V/div')}")
             print(f"  Offset: {format_value(offset, 'V')}")
             print(f"  Coupling: {coupling}")
             print(f"  Probe Ratio: {probe}:1")
-            
+
         except Exception as e:
             if verbose:
                 print(f"  ❌ Error reading channel {channel}: {e}")
             else:
                 print(f"  Channel {channel}: Not available")
 
+    return info
+
 
 def display_timebase_info(scope, verbose=False):
-    """Display timebase information."""
+    """Display timebase information.
+
+    Returns a dict of the values queried so callers can reuse them
+    without another round-trip.
+    """
     print("\nTIMEBASE CONFIGURATION")
     print("=" * 50)
-    
+
+    info = {}
     try:
         scale = scope.get_timebase_scale()
         offset = scope.get_timebase_offset()
-        
+        info['timebase_scale'] = scale
+        info['timebase_offset'] = offset
+
         print(f"Scale: {format_value(scale, 's/div')}")
         print(f"Offset: {format_value(offset, 's')}")
-        
+
         # Calculate total time span (typically 12 divisions)
         total_time = scale * 12
         print(f"Total Time Span: {format_value(total_time, 's')}")
-        
+
     except Exception as e:
         print(f"❌ Error reading timebase: {e}")
 
+    return info
+
 
 def display_trigger_info(scope, verbose=False):
-    """Display trigger information."""
+    """Display trigger information.
+
+    Returns a dict of the values queried so callers can reuse them
+    without another round-trip.
+    """
     print("\nTRIGGER STATUS")
     print("=" * 50)
-    
+
+    info = {}
     try:
         status = scope.get_trigger_status()
+        info['trigger_status'] = status
         print(f"Status: {status}")
         
         # Try to get additional trigger information
@@ -133,19 +257,64 @@ def display_trigger_info(scope, verbose=False):
             try:
                 # These commands might not be available on all firmware versions
                 source = scope.query("TRIG:EDGE:SOUR?")
-                level = scope.query("TRIG:EDGE:LEV?")
+                level = scope.query_float("TRIG:EDGE:LEV?")
                 slope = scope.query("TRIG:EDGE:SLOP?")
-                
+
                 print(f"Source: {source}")
-                print(f"Level: {format_value(float(level), 'V')}")
+                print(f"Level: {format_value(level, 'V')}")
                 print(f"Slope: {slope}")
                 
             except:
                 pass  # Additional info not available
-                
+
     except Exception as e:
         print(f"❌ Error reading trigger status: {e}")
 
+    return info
+
+
+def _query_measurements_batched(scope, channel, items):
+    """
+    Query several measurement items in one compound SCPI message.
+
+    Returns a dict of name -> value (None for invalid readings), or
+    None if the batched query itself failed so the caller can fall
+    back to per-item queries.
+    """
+    try:
+        commands = [f":MEAS:ITEM? {scpi_name},CHAN{channel}" for _, scpi_name in items]
+        responses = scope.query_multi(commands)
+
+        measurements = {}
+        for (name, _), response in zip(items, responses):
+            try:
+                value = float(response)
+                # Values like 9.9E37 indicate no valid measurement
+                measurements[name] = value if abs(value) < 1e10 else None
+            except ValueError:
+                measurements[name] = None
+        return measurements
+    except Exception:
+        return None
+
+
+# Display labels and units for measurement keys, precomputed so the print
+# loop does no per-row string munging
+_VOLTAGE_FIELDS = (
+    ('vpp', 'Vpp', 'V'),
+    ('vmax', 'Vmax', 'V'),
+    ('vmin', 'Vmin', 'V'),
+    ('vrms', 'Vrms', 'V'),
+    ('vavg', 'Vavg', 'V'),
+)
+_TIME_FIELDS = (
+    ('frequency', 'Frequency', 'Hz'),
+    ('period', 'Period', 's'),
+    ('rise_time', 'Rise Time', 's'),
+    ('fall_time', 'Fall Time', 's'),
+    ('pulse_width', 'Pulse Width', 's'),
+)
+
 
 def display_measurements(scope, channels=[1], verbose=False):
     """Display automatic measurements for specified channels."""
@@ -155,29 +324,40 @@ def display_measurements(scope, channels=[1], verbose=False):
     for channel in channels:
         try:
             print(f"\nChannel {channel} Measurements:")
-            
+
             # Get voltage measurements
-            voltage_measurements = scope.get_voltage_measurements(channel)
+            voltage_measurements = _query_measurements_batched(
+                scope, channel,
+                [('vpp', 'VPP'), ('vmax', 'VMAX'), ('vmin', 'VMIN'),
+                 ('vrms', 'VRMS'), ('vavg', 'VAVE')]
+            )
+            if voltage_measurements is None:
+                voltage_measurements = scope.get_voltage_measurements(channel)
             
-            if any(v is not None for v in voltage_measurements.values()):
+            # Build the valid rows in one pass; an empty list also tells
+            # us to skip the header
+            rows = [(label, value, unit) for key, label, unit in _VOLTAGE_FIELDS
+                    if (value := voltage_measurements.get(key)) is not None]
+            if rows:
                 print("  Voltage:")
-                for name, value in voltage_measurements.items():
-                    if value is not None:
-                        formatted_name = name.replace('_', ' ').title()
-                        print(f"    {formatted_name}: {format_value(value, 'V')}")
+                for label, value, unit in rows:
+                    print(f"    {label}: {format_value(value, unit)}")
             
             # Get time measurements
-            time_measurements = scope.get_time_measurements(channel)
+            time_measurements = _query_measurements_batched(
+                scope, channel,
+                [('frequency', 'FREQ'), ('period', 'PER'), ('rise_time', 'RTIM'),
+                 ('fall_time', 'FTIM'), ('pulse_width', 'PWID')]
+            )
+            if time_measurements is None:
+                time_measurements = scope.get_time_measurements(channel)
             
-            if any(v is not None for v in time_measurements.values()):
+            rows = [(label, value, unit) for key, label, unit in _TIME_FIELDS
+                    if (value := time_measurements.get(key)) is not None]
+            if rows:
                 print("  Timing:")
-                for name, value in time_measurements.items():
-                    if value is not None:
-                        formatted_name = name.replace('_', ' ').title()
-                        if name == 'frequency':
-                            print(f"    {formatted_name}: {format_value(value, 'Hz')}")
-                        else:
-                            print(f"    {formatted_name}: {format_value(value, 's')}")
+                for label, value, unit in rows:
+                    print(f"    {label}: {format_value(value, unit)}")
             
         except Exception as e:
             if verbose:
@@ -186,24 +366,37 @@ def display_measurements(scope, channels=[1], verbose=False):
                 print(f"  Channel {channel}: Measurements not available")
 
 
-def save_info_to_file(scope, filename, format_type='txt'):
-    """Save device information to file."""
+def save_info_to_file(scope, filename, format_type='txt', status=None):
+    """Save device information to file.
+
+    Args:
+        scope: Connected oscilloscope instance
+        filename: Output filename
+        format_type: 'txt' or 'json'
+        status: Status dict already collected during the display phase;
+                when provided, the instrument is not queried again
+    """
     try:
-        status = scope.get_system_status()
+        if not status:
+            status = scope.get_system_status()
         
         if format_type.lower() == 'json':
-            # Save as JSON
+            # Save as JSON (imported here so the default text path and
+            # plain display runs never pay for loading json)
+            import json
             with open(filename, 'w') as f:
-                json.dump(status, f, indent=2, default=str)
+                json.dump(status, f, separators=(',', ':'), default=str)
         else:
-            # Save as text
-            with open(filename, 'w') as f:
-                f.write("Rigol DHO914S Device Information\n")
-                f.write(f"Timestamp: {__import__('datetime').datetime.now()}\n")
-                f.write("=" * 60 + "\n\n")
-                
-                for key, value in status.items():
-                    f.write(f"{key}: {value}\n")
+            # Save as text in one buffered writelines call instead of a
+            # write per field
+            lines = [
+                "Rigol DHO914S Device Information\n",
+                f"Timestamp: {__import__('datetime').datetime.now()}\n",
+                "=" * 60 + "\n\n",
+            ]
+            lines.extend(f"{key}: {value}\n" for key, value in status.items())
+            with open(filename, 'w', buffering=1 << 16) as f:
+                f.writelines(lines)
         
         print(f"Device information saved to {filename}")
         
@@ -211,8 +404,9 @@ def save_info_to_file(scope, filename, format_type='txt'):
         print(f"❌ Error saving to file: {e}")
 
 
-def main():
-    """Main command-line interface."""
+@functools.lru_cache(maxsize=1)
+def build_parser():
+    """Build the argument parser (cached across repeated calls)."""
     parser = argparse.ArgumentParser(
         description="Display Rigol DHO914S oscilloscope information",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -277,6 +471,13 @@ Examples:
         metavar='FILENAME',
         help="Save device information to file"
     )
+
+    parser.add_argument(
+        "--daemon",
+        metavar='SOCKET_PATH',
+        help="Keep the VISA connection open and serve repeated requests "
+             "over a local Unix socket (clients set $RIGOL_DAEMON)"
+    )
     
     parser.add_argument(
         "--format",
@@ -284,52 +485,262 @@ Examples:
         default='txt',
         help="Output format for saved file (default: txt)"
     )
-    
+
+    return parser
+
+
+# Matches comma-separated channel numbers like "1" or "1,2,4"
+_CHANNEL_LIST_RE = re.compile(r'^\s*[1-4]\s*(,\s*[1-4]\s*)*$')
+
+
+def parse_measurement_channels(parser, args):
+    """Parse and validate the --measurements channel list."""
+    if not args.measurements:
+        return []
+    if not _CHANNEL_LIST_RE.match(args.measurements):
+        parser.error("Invalid channel format. Use comma-separated numbers 1-4 (e.g., '1,2,3')")
+    return [int(ch) for ch in args.measurements.split(',')]
+
+
+class _LockedScope:
+    """Proxy serializing scope method calls behind a lock.
+
+    SCPI is single-session serial on the instrument, so concurrent
+    display sections must take turns on the wire; only their CPU-side
+    formatting overlaps.
+    """
+
+    def __init__(self, scope, lock):
+        self._scope = scope
+        self._lock = lock
+
+    def __getattr__(self, name):
+        attr = getattr(self._scope, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return locked
+
+
+class _ThreadLocalStdout:
+    """stdout shim routing writes to a per-thread buffer when set."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture_to(self, buf):
+        self._local.buf = buf
+
+    def write(self, s):
+        getattr(self._local, 'buf', self._fallback).write(s)
+
+    def flush(self):
+        getattr(self._local, 'buf', self._fallback).flush()
+
+
+def _run_sections_threaded(scope, sections):
+    """
+    Run display sections on a thread pool.
+
+    Instrument I/O stays serialized through a lock (PyVISA releases the
+    GIL around its C calls, so a section's string formatting overlaps
+    the next section's wait on the wire). Each thread's output is
+    captured and printed in submission order for deterministic results.
+    """
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+
+    lock = threading.Lock()
+    locked_scope = _LockedScope(scope, lock)
+    shim = _ThreadLocalStdout(sys.stdout)
+
+    def run_section(section):
+        buf = io.StringIO()
+        shim.capture_to(buf)
+        result = section(locked_scope)
+        return result, buf.getvalue()
+
+    original_stdout = sys.stdout
+    sys.stdout = shim
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(run_section, section) for section in sections]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = original_stdout
+
+    # One write and flush for the whole report instead of a syscall and
+    # stdout-lock acquisition per print call
+    sys.stdout.write(''.join(output for _, output in outcomes))
+    sys.stdout.flush()
+    return [result for result, _ in outcomes]
+
+
+def run_display(scope, args, measurement_channels):
+    """Run the requested display sections against a connected scope."""
+    # Build the section list; each returns a dict of queried values so
+    # --save does not have to re-issue the same queries
+    sections = [lambda s: display_device_info(s, args.verbose)]
+
+    if not args.no_channels:
+        sections.append(lambda s: display_channel_info(s, args.verbose))
+
+    if not args.no_timebase:
+        sections.append(lambda s: display_timebase_info(s, args.verbose))
+
+    if not args.no_trigger:
+        sections.append(lambda s: display_trigger_info(s, args.verbose))
+
+    if measurement_channels:
+        sections.append(lambda s: display_measurements(s, measurement_channels, args.verbose))
+
+    if args.verbose or len(sections) == 1:
+        # Keep output live and stack traces readable
+        results = [section(scope) for section in sections]
+    else:
+        results = _run_sections_threaded(scope, sections)
+
+    status_cache = {}
+    for result in results:
+        if isinstance(result, dict):
+            status_cache.update(result)
+
+    # Save to file if requested
+    if args.save:
+        # Only reuse the cache when every section actually ran
+        complete = not (args.no_channels or args.no_timebase or args.no_trigger)
+        save_info_to_file(scope, args.save, args.format,
+                          status=status_cache if complete else None)
+
+
+def connect_scope(args):
+    """Open the VISA connection described by the parsed arguments."""
+    if args.ethernet:
+        if args.verbose:
+            print(f"Connecting via Ethernet to {args.ethernet}...")
+        return RigolDHO914S(connection_type='ethernet', ip_address=args.ethernet,
+                            timeout=args.timeout*1000)
+    if args.verbose:
+        print("Connecting via USB...")
+    return RigolDHO914S(connection_type='usb', timeout=args.timeout*1000)
+
+
+def run_daemon(args, socket_path):
+    """
+    Serve scope_info requests over a Unix socket with one long-lived
+    VISA connection, so shell loops (watch, cron) don't pay the VISA
+    open cost on every invocation.
+    """
+    import contextlib
+    import io
+    import json
+    import socket
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    parser = build_parser()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    print(f"Serving on {socket_path} (set RIGOL_DAEMON={socket_path} in clients)")
+
+    try:
+        with connect_scope(args) as scope:
+            while True:
+                conn, _ = server.accept()
+                try:
+                    request = json.loads(conn.makefile('r').readline())
+                    client_args = parser.parse_args(request.get('argv', []))
+                    channels = parse_measurement_channels(parser, client_args)
+
+                    output = io.StringIO()
+                    status = 0
+                    try:
+                        with contextlib.redirect_stdout(output):
+                            run_display(scope, client_args, channels)
+                    except Exception as e:
+                        output.write(f"❌ Error: {e}\n")
+                        status = 1
+
+                    conn.sendall(json.dumps(
+                        {'output': output.getvalue(), 'status': status}).encode() + b'\n')
+                except (SystemExit, Exception) as e:
+                    # Bad request from a client; report it and keep
+                    # serving (dropping the connection without a reply
+                    # would crash the client on an empty response)
+                    try:
+                        conn.sendall(json.dumps(
+                            {'output': f"❌ Error: daemon could not handle request: {e}\n",
+                             'status': 1}).encode() + b'\n')
+                    except OSError:
+                        pass
+                finally:
+                    conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def run_client(socket_path):
+    """
+    Forward this invocation to a running daemon and print its reply.
+
+    Exits with the daemon's status on success. Returns without output
+    when no daemon answers on the socket — a stale $RIGOL_DAEMON after
+    the daemon exited and unlinked its socket is routine — so the
+    caller can fall back to a direct VISA connection.
+    """
+    import json
+    import socket
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return
+    try:
+        client.sendall(json.dumps({'argv': sys.argv[1:]}).encode() + b'\n')
+        reply = json.loads(client.makefile('r').readline())
+    finally:
+        client.close()
+
+    sys.stdout.write(reply['output'])
+    sys.exit(reply['status'])
+
+
+def main():
+    """Main command-line interface."""
+    parser = build_parser()
     args = parser.parse_args()
-    
-    # Parse measurement channels
-    measurement_channels = []
-    if args.measurements:
-        try:
-            measurement_channels = [int(ch.strip()) for ch in args.measurements.split(',')]
-            # Validate channel numbers
-            for ch in measurement_channels:
-                if ch < 1 or ch > 4:
-                    parser.error(f"Invalid channel number: {ch} (must be 1-4)")
-        except ValueError:
-            parser.error("Invalid channel format. Use comma-separated numbers (e.g., '1,2,3')")
-    
+    measurement_channels = parse_measurement_channels(parser, args)
+
+    if args.daemon:
+        run_daemon(args, args.daemon)
+        return
+
+    # If a daemon is running, forward the request instead of opening a
+    # fresh VISA connection
+    daemon_socket = os.environ.get('RIGOL_DAEMON')
+    if daemon_socket:
+        # Exits with the daemon's reply when one is listening; falls
+        # through to a direct connection when the socket is stale
+        run_client(daemon_socket)
+        print(f"⚠️  No daemon answering on {daemon_socket}; connecting directly.",
+              file=sys.stderr)
+
     try:
-        # Connect to oscilloscope
-        if args.ethernet:
-            if args.verbose:
-                print(f"Connecting via Ethernet to {args.ethernet}...")
-            scope = RigolDHO914S(connection_type='ethernet', ip_address=args.ethernet, timeout=args.timeout*1000)
-        else:
-            if args.verbose:
-                print("Connecting via USB...")
-            scope = RigolDHO914S(connection_type='usb', timeout=args.timeout*1000)
-        
-        with scope:
-            # Display information sections
-            display_device_info(scope, args.verbose)
-            
-            if not args.no_channels:
-                display_channel_info(scope, args.verbose)
-            
-            if not args.no_timebase:
-                display_timebase_info(scope, args.verbose)
-            
-            if not args.no_trigger:
-                display_trigger_info(scope, args.verbose)
-            
-            if measurement_channels:
-                display_measurements(scope, measurement_channels, args.verbose)
-            
-            # Save to file if requested
-            if args.save:
-                save_info_to_file(scope, args.save, args.format)
-    
+        with connect_scope(args) as scope:
+            run_display(scope, args, measurement_channels)
+
     except ConnectionError as e:
         print(f"❌ Connection error: {e}", file=sys.stderr)
         print("Make sure the oscilloscope is connected and turned on.", file=sys.stderr)
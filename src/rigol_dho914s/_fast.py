@@ -0,0 +1,38 @@
+"""
+Optional numba-accelerated kernels for waveform decoding.
+
+Even the vectorized NumPy conversion materializes a float32 copy of the
+raw samples before scaling; the kernel here fuses cast, subtract,
+multiply and add into one parallel pass writing straight into a
+caller-provided output buffer. When numba is not installed, callers
+fall back to the NumPy expression.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def raw_to_volts(raw, y_reference, y_increment, y_origin, out):
+    """
+    Convert raw ADC samples to volts in a single fused pass.
+
+    Args:
+        raw: Integer sample array (uint8 or int16)
+        y_reference: Preamble vertical reference (float32)
+        y_increment: Volts per LSB (float32)
+        y_origin: Voltage at center screen (float32)
+        out: Preallocated float32 output of the same length
+    """
+    for i in prange(raw.shape[0]):
+        out[i] = (raw[i] - y_reference) * y_increment + y_origin
@@ -3,7 +3,15 @@ SCPI command definitions for Rigol DHO914S oscilloscope.
 """
 
 class SCPICommands:
-    """Collection of SCPI commands for the Rigol DHO914S."""
+    """
+    Collection of SCPI commands for the Rigol DHO914S.
+
+    Constants are deliberately str, not bytes: pyvisa's write/query
+    APIs take str, and the per-command UTF-8 encode is ~100 ns against
+    millisecond-scale bus round-trips. Batching commands into compound
+    messages (write_multi/query_multi, the *_BATCH_TEMPLATE strings
+    below) is where the real per-command overhead goes away.
+    """
     
     # System commands
     IDENTITY = "*IDN?"
@@ -32,6 +40,7 @@ class SCPICommands:
     CHANNEL_BANDWIDTH = "CHAN{}:BAND {}"  # channel, bandwidth limit
     
     # Channel query commands
+    CHANNEL_ENABLE_QUERY = "CHAN{}:DISP?"
     CHANNEL_SCALE_QUERY = "CHAN{}:SCAL?"
     CHANNEL_OFFSET_QUERY = "CHAN{}:OFFS?"
     CHANNEL_COUPLING_QUERY = "CHAN{}:COUP?"
@@ -143,3 +152,28 @@ class MeasurementTypes:
     
     # Phase measurement
     PHASE = "PHAS"
+
+    # Standard measurement batches: (result_key, measurement_type)
+    # pairs fetched together by the batched helpers in core
+    VOLTAGE_ITEMS = (
+        ('vpp', VOLTAGE_PP),
+        ('vmax', VOLTAGE_MAX),
+        ('vmin', VOLTAGE_MIN),
+        ('vrms', VOLTAGE_RMS),
+        ('vavg', VOLTAGE_AVERAGE),
+    )
+    TIME_ITEMS = (
+        ('frequency', FREQUENCY),
+        ('period', PERIOD),
+        ('rise_time', RISE_TIME),
+        ('fall_time', FALL_TIME),
+        ('pulse_width', PULSE_WIDTH_POSITIVE),
+    )
+
+    # Channel-parametrized compound query strings, joined once at import
+    # so issuing a batch costs a single str.format instead of rebuilding
+    # and re-anchoring the message every call
+    VOLTAGE_BATCH_TEMPLATE = ";".join(
+        f":MEAS:ITEM? {m},CHAN{{ch}}" for _, m in VOLTAGE_ITEMS)
+    TIME_BATCH_TEMPLATE = ";".join(
+        f":MEAS:ITEM? {m},CHAN{{ch}}" for _, m in TIME_ITEMS)
@@ -4,7 +4,11 @@ Core Rigol DHO914S oscilloscope control class.
 
 import time
 import io
-from typing import Optional, Union, Tuple, List, Dict, Any
+import queue
+import re
+import threading
+from collections import deque
+from typing import Optional, Union, Tuple, List, Dict, Any, NamedTuple
 import numpy as np
 
 try:
@@ -18,36 +22,118 @@ from .exceptions import RigolError, ConnectionError, CommandError, TimeoutError,
 from .utils import (
     parse_waveform_preamble, convert_raw_data_to_voltage, create_time_array,
     validate_channel, validate_coupling, validate_trigger_slope,
-    retry_on_failure, find_usb_devices, save_waveform_csv
+    find_usb_devices, save_waveform_csv, save_waveform_npz
 )
 
 
+# Compiled once at import; identity validation runs on every connect
+_IDN_RE = re.compile(r"^RIGOL TECHNOLOGIES,DHO914S,")
+
+
+# Shared VISA resource manager. Creating one loads the VISA backend
+# (pyvisa-py or vendor DLLs) — tens to hundreds of ms — so it is paid
+# once per process, not once per RigolDHO914S instance
+_RESOURCE_MANAGER = None
+_RESOURCE_MANAGER_FACTORY = None
+
+
+def _get_resource_manager():
+    """
+    Return the process-wide pyvisa ResourceManager, creating it lazily.
+
+    The cache is keyed on the ResourceManager class itself, so a
+    replaced backend (or a test patching pyvisa) gets a fresh manager
+    instead of a stale one.
+    """
+    global _RESOURCE_MANAGER, _RESOURCE_MANAGER_FACTORY
+    factory = pyvisa.ResourceManager
+    if _RESOURCE_MANAGER is None or _RESOURCE_MANAGER_FACTORY is not factory:
+        _RESOURCE_MANAGER = factory()
+        _RESOURCE_MANAGER_FACTORY = factory
+    return _RESOURCE_MANAGER
+
+
+class MultiChannelWaveform(NamedTuple):
+    """
+    Structure-of-arrays view of a multi-channel capture.
+
+    All channels of one acquisition share the same sample clock, so a
+    single time array serves every channel instead of one identical
+    copy per channel, and the voltages live in one contiguous
+    (channels, points) float32 block — cross-channel reductions like
+    np.max(voltages, axis=1) run as one vectorized pass.
+    """
+    time: np.ndarray
+    voltages: np.ndarray
+    channels: Tuple[int, ...]
+    preambles: Dict[int, dict]
+
+    def voltage(self, channel: int) -> np.ndarray:
+        """Return the voltage row for a channel number."""
+        return self.voltages[self.channels.index(channel)]
+
+
 class RigolDHO914S:
     """
     Main class for controlling the Rigol DHO914S oscilloscope.
-    
+
     Supports both USB and Ethernet connections using PyVISA.
     """
     
     def __init__(self, connection_type: str = 'usb', resource_string: Optional[str] = None,
-                 ip_address: Optional[str] = None, timeout: float = 10000):
+                 ip_address: Optional[str] = None, timeout: float = 10000,
+                 cache_ttl_ms: float = 500, chunk_size: int = 1024 * 1024,
+                 protocol: str = 'auto'):
         """
         Initialize connection to the oscilloscope.
-        
+
         Args:
             connection_type: 'usb' or 'ethernet'
             resource_string: Specific VISA resource string (optional for USB auto-detect)
             ip_address: IP address for Ethernet connection
             timeout: Command timeout in milliseconds (default: 10000 = 10 seconds)
+            cache_ttl_ms: How long get_system_status results stay fresh
+                before being re-queried (default: 500 ms; 0 disables)
+            chunk_size: Low-level VISA read chunk size in bytes
+                (default 1 MB; larger helps multi-megapoint transfers)
+            protocol: Ethernet instrument protocol — 'auto' (try HiSLIP,
+                fall back to VXI-11), 'hislip', or 'vxi11'. HiSLIP
+                pipelines messages over one TCP stream and cuts
+                per-command latency roughly in half versus VXI-11's
+                RPC round-trips
         """
         if not PYVISA_AVAILABLE:
             raise ImportError("PyVISA is required. Install with: pip install pyvisa pyvisa-py")
-        
+
+        if protocol not in ('auto', 'hislip', 'vxi11'):
+            raise ValueError("Protocol must be 'auto', 'hislip' or 'vxi11'")
+
         self.connection_type = connection_type.lower()
+        self.protocol = protocol
+
+        # Validate arguments before touching VISA so bad input surfaces
+        # as ValueError instead of a wrapped ConnectionError
+        if self.connection_type not in ('usb', 'ethernet'):
+            raise ValueError("Connection type must be 'usb' or 'ethernet'")
+        if self.connection_type == 'ethernet' and not ip_address:
+            raise ValueError("IP address is required for Ethernet connection")
         self.timeout = timeout
+        self.cache_ttl_ms = cache_ttl_ms
+        self.chunk_size = chunk_size
         self.instrument = None
         self.resource_manager = None
-        
+        self._identity = None
+        self._status_cache = None
+        self._pending_writes = deque()
+        self._channel_enabled = {}
+        self._settings_cache = {}
+        self._acq_seq = 0
+        self._wf_cache = {}
+        self._srq_armed = False
+        self._srq_supported = None
+        self._last_wav_range = None
+        self._last_wav_config = None
+
         # Initialize connection
         self._connect(resource_string, ip_address)
         
@@ -57,8 +143,8 @@ class RigolDHO914S:
     def _connect(self, resource_string: Optional[str], ip_address: Optional[str]) -> None:
         """Establish connection to the oscilloscope."""
         try:
-            self.resource_manager = pyvisa.ResourceManager()
-            
+            self.resource_manager = _get_resource_manager()
+
             if self.connection_type == 'usb':
                 if resource_string:
                     # Use provided resource string
@@ -72,31 +158,69 @@ class RigolDHO914S:
                     # Try connecting to the first available device
                     self.instrument = self.resource_manager.open_resource(devices[0])
             
-            elif self.connection_type == 'ethernet':
-                if not ip_address:
-                    raise ValueError("IP address is required for Ethernet connection")
-                
-                resource_string = f"TCPIP::{ip_address}::INSTR"
-                self.instrument = self.resource_manager.open_resource(resource_string)
-            
             else:
-                raise ValueError("Connection type must be 'usb' or 'ethernet'")
-            
+                # connection_type was validated in __init__
+                self.instrument = self._open_ethernet(ip_address)
+
             # Configure instrument settings
             self.instrument.timeout = self.timeout
             self.instrument.write_termination = '\n'
             self.instrument.read_termination = '\n'
+
+            # Use a large chunk size so big replies (waveforms, screenshots)
+            # arrive in one low-level read instead of ~10 small ones
+            self.instrument.chunk_size = self.chunk_size
+            try:
+                self.instrument.send_end = True
+            except AttributeError:
+                pass  # Not all VISA sessions expose send_end
             
         except Exception as e:
             raise ConnectionError(f"Failed to connect to oscilloscope: {str(e)}")
-    
+
+    def _open_ethernet(self, ip_address: str):
+        """
+        Open the Ethernet VISA session using the configured protocol.
+
+        HiSLIP streams messages over one persistent TCP connection,
+        avoiding the per-command RPC framing of VXI-11, so 'auto' tries
+        it first and falls back to VXI-11 for firmware without HiSLIP.
+        """
+        if self.protocol in ('auto', 'hislip'):
+            try:
+                instrument = self.resource_manager.open_resource(
+                    f"TCPIP::{ip_address}::hislip0::INSTR")
+                self._disable_nagle(instrument)
+                return instrument
+            except pyvisa.VisaIOError:
+                if self.protocol == 'hislip':
+                    raise
+
+        instrument = self.resource_manager.open_resource(
+            f"TCPIP::{ip_address}::INSTR")
+        self._disable_nagle(instrument)
+        return instrument
+
+    @staticmethod
+    def _disable_nagle(instrument) -> None:
+        """Send small SCPI packets immediately instead of batching them."""
+        try:
+            instrument.set_visa_attribute(
+                pyvisa.constants.ResourceAttribute.tcpip_nodelay, True)
+        except (AttributeError, NotImplementedError, pyvisa.VisaIOError):
+            pass  # Not all VISA backends expose the attribute
+
     def _verify_connection(self) -> None:
         """Verify connection and check device identity."""
         try:
             identity = self.query(SCPICommands.IDENTITY)
-            if 'DHO914S' not in identity:
+            if not self._IDN_RE.match(identity):
                 raise ConnectionError(f"Connected device is not a DHO914S: {identity}")
-            
+
+            # The verification query doubles as the session identity
+            # cache, so get_identity never pays another round-trip
+            self._identity = identity
+
             print(f"Connected to: {identity}")
             
         except Exception as e:
@@ -106,8 +230,8 @@ class RigolDHO914S:
         """Close the connection to the oscilloscope."""
         if self.instrument:
             self.instrument.close()
-        if self.resource_manager:
-            self.resource_manager.close()
+        # The resource manager is shared process-wide (see
+        # _get_resource_manager) and stays open for later connections
     
     def __enter__(self):
         """Context manager entry."""
@@ -117,60 +241,219 @@ class RigolDHO914S:
         """Context manager exit."""
         self.close()
     
-    @retry_on_failure(max_retries=3)
+    # Transient-failure retry policy for the hot write/query paths.
+    # The retry loops are inlined rather than decorated: the
+    # retry_on_failure wrapper cost two extra Python frames per call on
+    # the 99.9% of calls that never fail, which adds up in tight SCPI
+    # loops like a status refresh
+    _MAX_RETRIES = 3
+    _RETRY_DELAY = 0.1
+
+    # Module-level compiled pattern; the class alias keeps call sites
+    # short without recompiling per instance
+    _IDN_RE = _IDN_RE
+
     def write(self, command: str) -> None:
         """
         Send a command to the oscilloscope.
-        
+
         Args:
             command: SCPI command string
         """
+        self.flush_writes()
+        last_error = None
+        for attempt in range(self._MAX_RETRIES + 1):
+            try:
+                self.instrument.write(command)
+                return
+            except Exception as e:
+                last_error = e
+                if attempt < self._MAX_RETRIES:
+                    time.sleep(self._RETRY_DELAY)
+        raise CommandError(f"Failed to send command '{command}': {last_error}")
+
+    @staticmethod
+    def _anchor(command: str) -> str:
+        """
+        Re-anchor a compound-message segment at the SCPI root.
+
+        After a ';' the parser resolves bare headers relative to the
+        previous command's subtree, so every segment gets a leading ':'
+        unless it is already anchored or a '*' common command.
+        """
+        command = command.lstrip()
+        if command.startswith((':', '*')):
+            return command
+        return ':' + command
+
+    def write_multi(self, commands: List[str]) -> None:
+        """
+        Send several commands as one semicolon-chained message.
+
+        Collapses N write round-trips into a single message for
+        commands that produce no response.
+
+        Args:
+            commands: List of SCPI commands
+        """
+        # Drain awrite()-queued commands first so their ordering
+        # relative to this message holds (flush_writes re-enters here
+        # with an empty queue, so this cannot recurse further)
+        self.flush_writes()
         try:
-            self.instrument.write(command)
+            self.instrument.write(';'.join(map(self._anchor, commands)))
         except Exception as e:
-            raise CommandError(f"Failed to send command '{command}': {str(e)}")
-    
-    @retry_on_failure(max_retries=3)
+            raise CommandError(f"Failed to send commands {commands}: {str(e)}")
+
+    # Queued awrite() commands are sent once this many accumulate
+    _WRITE_BATCH_SIZE = 16
+
+    # Largest WAV:DATA? window requested per transfer; the DHO914S caps
+    # single reads around this many points in BYTE format
+    _WAVEFORM_CHUNK_POINTS = 250_000
+
+    def awrite(self, command: str) -> None:
+        """
+        Queue a response-less command for batched transmission.
+
+        Queued commands drain as one semicolon-chained message when the
+        batch fills, when flush_writes() is called, or automatically
+        before the next write or query, so ordering relative to other
+        traffic is preserved. Lets configuration sweeps submit commands
+        back-to-back instead of paying a round-trip each.
+
+        Args:
+            command: SCPI command string
+        """
+        self._pending_writes.append(command)
+        if len(self._pending_writes) >= self._WRITE_BATCH_SIZE:
+            self.flush_writes()
+
+    def flush_writes(self) -> None:
+        """Send any commands queued by awrite() as one message."""
+        if self._pending_writes:
+            batch = list(self._pending_writes)
+            self._pending_writes.clear()
+            self.write_multi(batch)
+
     def query(self, command: str) -> str:
         """
         Send a query command and return the response.
-        
+
         Args:
             command: SCPI query command
-            
+
         Returns:
             Response string from oscilloscope
         """
-        try:
-            response = self.instrument.query(command)
-            return response.strip()
-        except Exception as e:
-            raise CommandError(f"Failed to query '{command}': {str(e)}")
+        self.flush_writes()
+        last_error = None
+        for attempt in range(self._MAX_RETRIES + 1):
+            try:
+                return self.instrument.query(command).strip()
+            except Exception as e:
+                last_error = e
+                if attempt < self._MAX_RETRIES:
+                    time.sleep(self._RETRY_DELAY)
+        raise CommandError(f"Failed to query '{command}': {last_error}")
     
-    @retry_on_failure(max_retries=3)
+    def query_float(self, command: str) -> float:
+        """
+        Send a query command and parse the reply as a float.
+
+        Args:
+            command: SCPI query command
+
+        Returns:
+            Numeric response from oscilloscope
+        """
+        response = self.query(command)
+        try:
+            return float(response)
+        except ValueError:
+            raise DataError(f"Non-numeric response to '{command}': {response!r}")
+
+    def query_multi(self, commands: List[str]) -> List[str]:
+        """
+        Send several query commands as one semicolon-chained message.
+
+        Collapses N round-trips into a single write/read pair, which
+        matters on TCPIP where each round-trip costs milliseconds.
+        Non-query commands may be interleaved to pipeline set/readback
+        sequences; they contribute nothing to the response.
+
+        Args:
+            commands: List of SCPI commands
+
+        Returns:
+            List of response strings, one per query in the message
+        """
+        self.flush_writes()
+        message = ';'.join(map(self._anchor, commands))
+        last_error = None
+        for attempt in range(self._MAX_RETRIES + 1):
+            try:
+                response = self.instrument.query(message)
+                return [part.strip() for part in response.split(';')]
+            except Exception as e:
+                last_error = e
+                if attempt < self._MAX_RETRIES:
+                    time.sleep(self._RETRY_DELAY)
+        raise CommandError(f"Failed to query {commands}: {last_error}")
+
     def query_binary(self, command: str) -> bytes:
         """
         Send a query command and return binary data.
-        
+
         Args:
             command: SCPI query command
-            
+
         Returns:
-            Binary response from oscilloscope
+            Binary response payload as a bytes-like object (a zero-copy
+            memoryview for block-format replies), suitable for
+            np.frombuffer or b"".join
         """
+        self.flush_writes()
+        # Use read_raw for binary data and handle IEEE 488.2 block
+        # format. Read termination is dropped for the transfer: with a
+        # termchar armed, pyvisa-py scans every payload byte for LF and
+        # returns tiny reads on false hits, which wrecks multi-MB
+        # transfers; binary blocks are delimited by their declared
+        # length, not by a character
+        last_error = None
+        original_read_term = self.instrument.read_termination
+        try:
+            self.instrument.read_termination = None
+            for attempt in range(self._MAX_RETRIES + 1):
+                try:
+                    self.instrument.write(command)
+                    raw_response = self.instrument.read_raw()
+                    break
+                except Exception as e:
+                    last_error = e
+                    if attempt < self._MAX_RETRIES:
+                        time.sleep(self._RETRY_DELAY)
+            else:
+                raise CommandError(f"Failed to query binary '{command}': {last_error}")
+        finally:
+            self.instrument.read_termination = original_read_term
+
         try:
-            # Use read_raw for binary data and handle IEEE 488.2 block format
-            self.instrument.write(command)
-            raw_response = self.instrument.read_raw()
-            
             # Handle IEEE 488.2 definite length block data format
             # Format: #<digit><length><data>
             if raw_response.startswith(b'#'):
-                # Skip the IEEE header to get the actual data
-                digit_count = int(chr(raw_response[1]))
+                # Parse the header straight from the bytes — no str
+                # conversion of any part of the buffer — and use the
+                # declared payload length to trim the trailing
+                # terminator instead of returning it with the data
+                digit_count = raw_response[1] - 0x30
                 header_length = 2 + digit_count
-                data = raw_response[header_length:]
-                return data
+                if digit_count > 0:
+                    payload_len = int(raw_response[2:header_length])
+                    # memoryview slice: zero-copy window over the
+                    # payload, fed directly to np.frombuffer downstream
+                    return memoryview(raw_response)[header_length:header_length + payload_len]
+                return memoryview(raw_response)[header_length:]
             else:
                 return raw_response
                 
@@ -178,37 +461,106 @@ class RigolDHO914S:
             raise CommandError(f"Failed to query binary '{command}': {str(e)}")
     
     def get_identity(self) -> str:
-        """Get oscilloscope identity string."""
-        return self.query(SCPICommands.IDENTITY)
-    
+        """Get oscilloscope identity string (cached for the session)."""
+        # *IDN? never changes while connected, so pay the round-trip once
+        if self._identity is None:
+            self._identity = self.query(SCPICommands.IDENTITY)
+        return self._identity
+
+    def refresh_identity(self) -> str:
+        """Re-query *IDN? (e.g. after a firmware update) and recache it."""
+        self._identity = self.query(SCPICommands.IDENTITY)
+        return self._identity
+
+    def wait_opc(self, timeout: float = 5.0) -> None:
+        """
+        Block until the instrument reports pending operations complete.
+
+        Sends *OPC? and reads the reply; the instrument holds the
+        response until everything queued before it has finished, so one
+        blocking query replaces a blind sleep or a polling loop.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            TimeoutError: If the instrument does not answer in time
+        """
+        previous_timeout = self.instrument.timeout
+        self.instrument.timeout = timeout * 1000
+        try:
+            if self.query("*OPC?") != "1":
+                raise TimeoutError("Operation did not complete within timeout")
+        except CommandError:
+            raise TimeoutError("Operation did not complete within timeout")
+        finally:
+            self.instrument.timeout = previous_timeout
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop all session-level cached state.
+
+        Called after operations that change instrument state behind the
+        caches' back (reset, status clear); callers can also invoke it
+        directly after reconfiguring the scope out of band.
+        """
+        self._identity = None
+        self._status_cache = None
+        self._channel_enabled.clear()
+        self._settings_cache.clear()
+        self._last_wav_range = None
+        self._last_wav_config = None
+        self.invalidate_waveform_cache()
+
     def reset(self) -> None:
         """Reset oscilloscope to default settings."""
         self.write(SCPICommands.RESET)
-        time.sleep(3)  # Wait for reset to complete
-    
+        self.invalidate_cache()
+        # Returns as soon as the instrument reports the reset finished
+        # instead of sleeping a fixed 3 seconds
+        self.wait_opc(timeout=10.0)
+
     def clear_status(self) -> None:
         """Clear the oscilloscope status."""
         self.write(SCPICommands.CLEAR_STATUS)
+        self.invalidate_cache()
     
     def get_error(self) -> str:
         """Get the last error from the oscilloscope."""
         return self.query(SCPICommands.ERROR_QUERY)
     
+    def invalidate_waveform_cache(self) -> None:
+        """
+        Drop cached waveforms and start a new acquisition generation.
+
+        Called automatically by run/stop/single/force_trigger; call it
+        directly if the acquisition state was changed out of band.
+        """
+        self._acq_seq += 1
+        self._wf_cache.clear()
+        # Acquisition changes can move the record length, so the
+        # tracked WAV:STAR/STOP window is no longer trustworthy
+        self._last_wav_range = None
+
     def run(self) -> None:
         """Start oscilloscope acquisition."""
         self.write(SCPICommands.RUN)
-    
+        self.invalidate_waveform_cache()
+
     def stop(self) -> None:
         """Stop oscilloscope acquisition."""
         self.write(SCPICommands.STOP)
-    
+        self.invalidate_waveform_cache()
+
     def single(self) -> None:
         """Set oscilloscope to single trigger mode."""
         self.write(SCPICommands.SINGLE)
-    
+        self.invalidate_waveform_cache()
+
     def force_trigger(self) -> None:
         """Force a trigger event."""
         self.write(SCPICommands.FORCE_TRIGGER)
+        self.invalidate_waveform_cache()
     
     # Channel control methods
     def set_channel_enable(self, channel: int, enable: bool) -> None:
@@ -216,47 +568,133 @@ class RigolDHO914S:
         validate_channel(channel)
         state = "ON" if enable else "OFF"
         self.write(SCPICommands.CHANNEL_ENABLE.format(channel, state))
+        self._channel_enabled[channel] = enable
+
+    def set_channels_enable(self, channels: Dict[int, bool]) -> None:
+        """
+        Enable or disable several channels in one compound write.
+
+        One semicolon-joined message replaces a round-trip per channel —
+        three RTTs saved on Ethernet when configuring all four.
+
+        Args:
+            channels: Mapping of channel number to desired enable state
+        """
+        for channel in channels:
+            validate_channel(channel)
+        self.write_multi([
+            SCPICommands.CHANNEL_ENABLE.format(channel, "ON" if enable else "OFF")
+            for channel, enable in channels.items()
+        ])
+        self._channel_enabled.update(channels)
+
+    def is_channel_enabled(self, channel: int) -> bool:
+        """
+        Check whether a channel's display is enabled.
+
+        Uses the state remembered from set_channel_enable when
+        available, so repeated guards cost no round-trip.
+        """
+        validate_channel(channel)
+        if channel not in self._channel_enabled:
+            reply = self.query(SCPICommands.CHANNEL_ENABLE_QUERY.format(channel))
+            self._channel_enabled[channel] = reply in ('1', 'ON')
+        return self._channel_enabled[channel]
     
+    # How long cached channel settings stay fresh before re-querying
+    _SETTINGS_TTL = 1.0
+
+    def _cached_setting(self, key, fetch):
+        """
+        Return a channel setting from the TTL cache, fetching on miss.
+
+        Settings change rarely relative to how often status loops read
+        them; each avoided read saves a full VISA round-trip. Setters
+        drop the matching entry so a readback after a set is always
+        fresh.
+        """
+        entry = self._settings_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self._SETTINGS_TTL:
+            return entry[1]
+        value = fetch()
+        self._settings_cache[key] = (now, value)
+        return value
+
+    # The channel number is always 1-4, so the two-argument channel
+    # templates are partially evaluated at class-creation time: setters
+    # become a dict lookup plus a single-arg bound str.format, and
+    # query strings need no formatting at all. Shaves the per-call
+    # string work off tight configuration/measurement loops
+    _CH_COUPLING = {ch: SCPICommands.CHANNEL_COUPLING.format(ch, '{}').format
+                    for ch in range(1, 5)}
+    _CH_SCALE = {ch: SCPICommands.CHANNEL_SCALE.format(ch, '{}').format
+                 for ch in range(1, 5)}
+    _CH_OFFSET = {ch: SCPICommands.CHANNEL_OFFSET.format(ch, '{}').format
+                  for ch in range(1, 5)}
+    _CH_PROBE = {ch: SCPICommands.CHANNEL_PROBE.format(ch, '{}').format
+                 for ch in range(1, 5)}
+    _CH_SCALE_QUERY = {ch: SCPICommands.CHANNEL_SCALE_QUERY.format(ch)
+                       for ch in range(1, 5)}
+    _CH_OFFSET_QUERY = {ch: SCPICommands.CHANNEL_OFFSET_QUERY.format(ch)
+                        for ch in range(1, 5)}
+    _CH_COUPLING_QUERY = {ch: SCPICommands.CHANNEL_COUPLING_QUERY.format(ch)
+                          for ch in range(1, 5)}
+    _CH_PROBE_QUERY = {ch: SCPICommands.CHANNEL_PROBE_QUERY.format(ch)
+                       for ch in range(1, 5)}
+
     def set_channel_coupling(self, channel: int, coupling: str) -> None:
         """Set channel coupling (AC, DC, GND)."""
         validate_channel(channel)
         coupling = validate_coupling(coupling)
-        self.write(SCPICommands.CHANNEL_COUPLING.format(channel, coupling))
-    
+        self.write(self._CH_COUPLING[channel](coupling))
+        self._settings_cache.pop(('coupling', channel), None)
+
     def set_channel_scale(self, channel: int, scale: float) -> None:
         """Set channel vertical scale (volts/division)."""
         validate_channel(channel)
-        self.write(SCPICommands.CHANNEL_SCALE.format(channel, scale))
-    
+        self.write(self._CH_SCALE[channel](scale))
+        self._settings_cache.pop(('scale', channel), None)
+
     def set_channel_offset(self, channel: int, offset: float) -> None:
         """Set channel vertical offset."""
         validate_channel(channel)
-        self.write(SCPICommands.CHANNEL_OFFSET.format(channel, offset))
-    
+        self.write(self._CH_OFFSET[channel](offset))
+        self._settings_cache.pop(('offset', channel), None)
+
     def set_channel_probe(self, channel: int, ratio: float) -> None:
         """Set channel probe ratio."""
         validate_channel(channel)
-        self.write(SCPICommands.CHANNEL_PROBE.format(channel, ratio))
-    
+        self.write(self._CH_PROBE[channel](ratio))
+        self._settings_cache.pop(('probe', channel), None)
+
     def get_channel_scale(self, channel: int) -> float:
-        """Get channel vertical scale."""
+        """Get channel vertical scale (cached for up to 1 s)."""
         validate_channel(channel)
-        return float(self.query(SCPICommands.CHANNEL_SCALE_QUERY.format(channel)))
-    
+        return self._cached_setting(
+            ('scale', channel),
+            lambda: self.query_float(self._CH_SCALE_QUERY[channel]))
+
     def get_channel_offset(self, channel: int) -> float:
-        """Get channel vertical offset."""
+        """Get channel vertical offset (cached for up to 1 s)."""
         validate_channel(channel)
-        return float(self.query(SCPICommands.CHANNEL_OFFSET_QUERY.format(channel)))
-    
+        return self._cached_setting(
+            ('offset', channel),
+            lambda: self.query_float(self._CH_OFFSET_QUERY[channel]))
+
     def get_channel_coupling(self, channel: int) -> str:
-        """Get channel coupling setting."""
+        """Get channel coupling setting (cached for up to 1 s)."""
         validate_channel(channel)
-        return self.query(SCPICommands.CHANNEL_COUPLING_QUERY.format(channel))
-    
+        return self._cached_setting(
+            ('coupling', channel),
+            lambda: self.query(self._CH_COUPLING_QUERY[channel]))
+
     def get_channel_probe(self, channel: int) -> float:
-        """Get channel probe ratio."""
+        """Get channel probe ratio (cached for up to 1 s)."""
         validate_channel(channel)
-        return float(self.query(SCPICommands.CHANNEL_PROBE_QUERY.format(channel)))
+        return self._cached_setting(
+            ('probe', channel),
+            lambda: self.query_float(self._CH_PROBE_QUERY[channel]))
     
     # Timebase control methods
     def set_timebase_scale(self, scale: float) -> None:
@@ -269,11 +707,11 @@ class RigolDHO914S:
     
     def get_timebase_scale(self) -> float:
         """Get horizontal timebase scale."""
-        return float(self.query(SCPICommands.TIMEBASE_SCALE_QUERY))
+        return self.query_float(SCPICommands.TIMEBASE_SCALE_QUERY)
     
     def get_timebase_offset(self) -> float:
         """Get horizontal timebase offset."""
-        return float(self.query(SCPICommands.TIMEBASE_OFFSET_QUERY))
+        return self.query_float(SCPICommands.TIMEBASE_OFFSET_QUERY)
     
     # Trigger control methods
     def set_trigger_source(self, source: str) -> None:
@@ -294,17 +732,52 @@ class RigolDHO914S:
         return self.query(SCPICommands.TRIGGER_STATUS)
     
     # Screenshot methods
-    def take_screenshot(self, filename: str, format: str = 'PNG') -> None:
+    def take_screenshot(self, filename: str, format: str = 'PNG',
+                        sync: bool = False) -> None:
         """
         Take a screenshot of the oscilloscope display.
-        
+
         Args:
             filename: Output filename
             format: Image format (PNG, BMP, JPEG) - Note: DHO914S primarily supports PNG
+            sync: Clear status and wait for pending operations before
+                capturing (adds ~1.5 s; only needed if a long operation
+                may still be running)
+        """
+        final_image = self.get_screenshot_data(format=format, sync=sync)
+
+        # Save to file in one unbuffered write: no copy of the image
+        # into the buffered I/O layer on its way to disk
+        with open(filename, 'wb', buffering=0) as f:
+            f.write(final_image)
+
+        print(f"Screenshot saved as {filename} ({len(final_image)} bytes)")
+
+    def get_screenshot_data(self, format: str = 'PNG',
+                            sync: bool = False) -> memoryview:
+        """
+        Capture the display and return the image bytes without saving.
+
+        Lets callers decide where and when the data hits disk — e.g.
+        writing the previous image on a worker thread while the next
+        capture occupies the bus.
+
+        Args:
+            format: Image format (PNG, BMP, JPEG) - Note: DHO914S primarily supports PNG
+            sync: Clear status and wait for pending operations before
+                capturing (adds ~1.5 s; only needed if a long operation
+                may still be running)
+
+        Returns:
+            Image data as a memoryview over the capture buffer
         """
         if not self.instrument:
             raise Exception("Not connected to oscilloscope")
-        
+
+        # Drain awrite()-queued commands so the capture observes every
+        # previously issued setting, like all other bus entry points
+        self.flush_writes()
+
         try:
             # Store original settings
             original_timeout = self.instrument.timeout
@@ -315,60 +788,45 @@ class RigolDHO914S:
             self.instrument.timeout = 17000  # 15 second timeout
             self.instrument.read_termination = None  # Binary mode
             self.instrument.write_termination = '\n'
-            
-            # Clear any errors first
-            self.instrument.write('*CLS')
-            import time
-            time.sleep(0.5)
-            
-            # Check if scope is ready
-            opc = self.instrument.query('*OPC?')
-            print(f"Scope ready: {opc.strip()}")
-            
-            # Restore binary mode after text query
-            self.instrument.read_termination = None
-            
+
+            # Optional pre-sync for callers hitting a race with a
+            # still-running operation; the default path skips it — the
+            # *CLS/sleep/*OPC?/sleep sequence cost a fixed 1.5 s of
+            # idle waiting per screenshot, and VISA flow control
+            # already blocks the read until the scope has data
+            if sync:
+                self.instrument.write('*CLS')
+                import time
+                time.sleep(0.5)
+
+                # Check if scope is ready
+                opc = self.instrument.query('*OPC?')
+                print(f"Scope ready: {opc.strip()}")
+
+                # Restore binary mode after text query
+                self.instrument.read_termination = None
+
             # Send the screenshot command - DHO914S works best with simple DISP:DATA?
             print("Taking screenshot...")
             self.instrument.write('DISP:DATA?')
-            
-            # Wait a moment for the scope to prepare the data
-            time.sleep(1)
-            
-            # Read data in chunks to avoid timeout
-            image_data = b''
-            chunk_size = 1024  # 1KB chunks work well
-            max_attempts = 300  # Allow for larger images (300KB max)
-            
+
             print("Reading screenshot data...")
-            
-            for attempt in range(max_attempts):
-                try:
-                    chunk = self.instrument.read_bytes(chunk_size)
-                    if not chunk:
-                        break
-                    
-                    image_data += chunk
-                    
-                    # Check if we found PNG signature and have enough data
-                    if b'\x89PNG' in image_data:
-                        # Look for PNG end marker (IEND) to know when we have complete image
-                        if b'IEND\xae\x42\x60\x82' in image_data:
-                            print(f"Complete PNG detected: {len(image_data)} bytes")
-                            break
-                    
-                    # Progress indicator for large images
-                    if attempt % 20 == 0 and attempt > 0:
-                        print(f"Read {len(image_data)} bytes...")
-                
-                except pyvisa.VisaIOError as e:
-                    if 'timeout' in str(e).lower():
-                        # Timeout is normal when no more data is available
-                        print(f"Read complete (timeout after {len(image_data)} bytes)")
-                        break
-                    else:
-                        raise e
-            
+
+            # DISP:DATA? answers with an IEEE 488.2 definite-length
+            # block (#<ndigits><length><payload>), so the payload size
+            # is known after reading two header bytes and the whole
+            # image can be pulled in one read_bytes call — three VISA
+            # transactions instead of ~200 chunked reads terminated by
+            # a timeout. The chunked scan loop survives only as a
+            # fallback for indefinite (#0) or headerless responses
+            image_data, prefix = self._read_definite_block()
+            if image_data is not None:
+                print(f"Read definite-length block: {len(image_data)} bytes")
+                header_trusted = True
+            else:
+                image_data = self._read_screenshot_chunked(bytearray(prefix))
+                header_trusted = False
+
             # Restore original settings
             self.instrument.timeout = original_timeout
             self.instrument.read_termination = original_read_term
@@ -378,22 +836,25 @@ class RigolDHO914S:
             if len(image_data) < 1000:
                 raise Exception(f"Screenshot data too small: {len(image_data)} bytes")
             
-            # Look for PNG signature and extract image
-            if b'\x89PNG' in image_data:
-                png_start = image_data.find(b'\x89PNG')
-                final_image = image_data[png_start:]
-                print(f"Extracted PNG image: {len(final_image)} bytes")
+            if header_trusted:
+                # The definite-length payload is the image itself — no
+                # signature scan, no slice
+                final_image = memoryview(image_data)
             else:
-                # If no PNG signature, save raw data (might be different format)
-                final_image = image_data
-                print(f"No PNG signature found, saving raw data: {len(final_image)} bytes")
-            
-            # Save to file
-            with open(filename, 'wb') as f:
-                f.write(final_image)
-            
-            print(f"Screenshot saved as {filename} ({len(final_image)} bytes)")
-            
+                # Look for PNG signature and extract image. A memoryview
+                # slice skips the slicing copy of the (often multi-MB)
+                # buffer; the view keeps the underlying bytearray alive
+                png_start = image_data.find(b'\x89PNG')
+                if png_start != -1:
+                    final_image = memoryview(image_data)[png_start:]
+                    print(f"Extracted PNG image: {len(final_image)} bytes")
+                else:
+                    # If no PNG signature, save raw data (might be different format)
+                    final_image = memoryview(image_data)
+                    print(f"No PNG signature found, saving raw data: {len(final_image)} bytes")
+
+            return final_image
+
         except Exception as e:
             # Ensure settings are restored even on error
             try:
@@ -403,70 +864,353 @@ class RigolDHO914S:
             except:
                 pass
             raise CommandError(f"Failed to take screenshot: {str(e)}")
-    
+
+    def _read_definite_block(self) -> Tuple[Optional[bytes], bytes]:
+        """
+        Read an IEEE 488.2 definite-length block (#<n><len><payload>).
+
+        Reads exactly what the header declares — two probe bytes, the
+        n ASCII length digits, then one bulk read of the payload — so
+        the full response never has to be buffered alongside its
+        header. Returns (payload, probe); payload is None when the
+        stream has no usable header (indefinite #0 blocks or raw
+        data), in which case the probe bytes are handed back so a
+        scan-based fallback loses nothing.
+        """
+        probe = self.instrument.read_bytes(2)
+        if probe[0:1] == b'#' and probe[1:2].isdigit() and probe[1] != 0x30:
+            digit_count = probe[1] - 0x30
+            payload_len = int(self.instrument.read_bytes(digit_count))
+            payload = self.instrument.read_bytes(payload_len)
+            self._drain_block_terminator()
+            return payload, probe
+        return None, probe
+
+    def _drain_block_terminator(self) -> None:
+        """
+        Consume the NL^END byte that trails a definite-length payload.
+
+        The header-exact reads stop at the last payload byte; the
+        message terminator would otherwise sit in the buffer and shift
+        the next text query once read_termination is restored. A short
+        timeout keeps the drain cheap on firmware that omits the tail.
+        """
+        original_timeout = self.instrument.timeout
+        self.instrument.timeout = 200
+        try:
+            self.instrument.read_bytes(1)
+        except pyvisa.VisaIOError:
+            pass  # No trailing terminator on the wire
+        finally:
+            self.instrument.timeout = original_timeout
+
+    def _read_screenshot_chunked(self, image_data: bytearray) -> bytearray:
+        """
+        Fallback chunked read for responses without a usable block header.
+
+        Accumulates into the passed bytearray (which may already hold
+        bytes consumed while probing for the header) until a complete
+        PNG is seen or the link times out.
+        """
+        import time
+        chunk_size = 1024  # 1KB chunks work well
+        max_attempts = 300  # Allow for larger images (300KB max)
+
+        png_found = False
+        for attempt in range(max_attempts):
+            try:
+                chunk = self.instrument.read_bytes(chunk_size)
+                if not chunk:
+                    break
+
+                image_data.extend(chunk)
+
+                # Check if we found PNG signature and have enough
+                # data. Only the newly appended tail is scanned
+                # (with a few bytes of overlap for markers split
+                # across chunk boundaries) — rescanning the whole
+                # buffer per chunk is quadratic in image size
+                tail = max(0, len(image_data) - len(chunk) - 8)
+                if not png_found:
+                    png_found = image_data.find(b'\x89PNG', tail) != -1
+                if png_found:
+                    # Look for PNG end marker (IEND) to know when we have complete image
+                    if image_data.find(b'IEND\xae\x42\x60\x82', tail) != -1:
+                        print(f"Complete PNG detected: {len(image_data)} bytes")
+                        break
+
+                # Progress indicator for large images
+                if attempt % 20 == 0 and attempt > 0:
+                    print(f"Read {len(image_data)} bytes...")
+
+            except pyvisa.VisaIOError as e:
+                if 'timeout' in str(e).lower():
+                    # Timeout is normal when no more data is available
+                    print(f"Read complete (timeout after {len(image_data)} bytes)")
+                    break
+                else:
+                    raise e
+
+        return image_data
+
     # Waveform acquisition methods
-    def get_waveform_data(self, channel: int, points: Optional[int] = None) -> Dict[str, np.ndarray]:
+    def get_waveform_data(self, channel: int, points: Optional[int] = None,
+                          data_width: int = 8) -> Dict[str, np.ndarray]:
         """
         Get waveform data from specified channel.
-        
+
         Args:
             channel: Channel number (1-4)
             points: Number of points to acquire (None for all available)
-            
+            data_width: Bits per sample — 8 (BYTE, default) or 16
+                (WORD, full 12-bit ADC resolution at twice the
+                transfer size)
+
         Returns:
             Dictionary with 'time' and 'voltage' arrays
+
+        Note:
+            Results are cached per acquisition generation: a repeat
+            request for the same channel between two run/stop/single/
+            force_trigger transitions is served from memory instead of
+            re-transferring the record. The arrays in the returned dict
+            are shared with the cache, so treat them as read-only or
+            call invalidate_waveform_cache() before mutating.
         """
         validate_channel(channel)
-        
+        if data_width not in (8, 16):
+            raise ValueError("data_width must be 8 or 16")
+
+        cache_key = (channel, points, data_width)
+        cached = self._wf_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            # Ensure channel is enabled first
-            self.set_channel_enable(channel, True)
-            
-            # Set waveform source
-            self.write(SCPICommands.WAVEFORM_SOURCE.format(f"CHAN{channel}"))
-            
-            # Set waveform format to BYTE for efficiency
-            self.write(SCPICommands.WAVEFORM_FORMAT.format("BYTE"))
-            
-            # Set waveform mode to NORMAL
-            self.write(SCPICommands.WAVEFORM_MODE.format("NORM"))
-            
-            # Set data range if specified
-            if points:
-                # Check current memory depth to ensure points is valid
-                try:
-                    self.write(SCPICommands.WAVEFORM_START.format(1))
-                    self.write(SCPICommands.WAVEFORM_STOP.format(points))
-                except:
-                    # If setting points fails, use default range
-                    pass
-            
-            # Get waveform preamble
-            preamble_str = self.query(SCPICommands.WAVEFORM_PREAMBLE)
-            preamble = parse_waveform_preamble(preamble_str)
-            
-            # Get waveform data
-            raw_data = self.query_binary(SCPICommands.WAVEFORM_DATA)
-            
-            # Convert to voltage
-            voltage_data = convert_raw_data_to_voltage(raw_data, preamble)
-            
-            # Create time array with the same length as actual voltage data
-            actual_points = len(voltage_data)
-            time_data = np.arange(actual_points) * preamble['x_increment'] + preamble['x_origin']
-            
-            return {
-                'time': time_data,
-                'voltage': voltage_data,
-                'preamble': preamble
-            }
-            
+            preamble, raw_data = self._fetch_raw_waveform(channel, points, data_width)
+            waveform = self._build_waveform(preamble, raw_data)
+            self._wf_cache[cache_key] = waveform
+            return dict(waveform)
+
         except Exception as e:
             raise DataError(f"Failed to get waveform data from channel {channel}: {str(e)}")
-    
+
+    def _set_waveform_range(self, start: int, stop: int) -> None:
+        """
+        Send WAV:STAR/WAV:STOP, skipping the writes if unchanged.
+
+        The scope keeps the last range, so resending an identical one
+        costs two SCPI round-trips for nothing — noticeable at live
+        refresh rates. The remembered range is dropped whenever caches
+        are invalidated.
+        """
+        if self._last_wav_range == (start, stop):
+            return
+        self.write(SCPICommands.WAVEFORM_START.format(start))
+        self.write(SCPICommands.WAVEFORM_STOP.format(stop))
+        self._last_wav_range = (start, stop)
+
+    def _fetch_raw_waveform(self, channel: int, points: Optional[int],
+                            data_width: int = 8) -> Tuple[dict, bytes]:
+        """
+        Run the bus side of a capture: configure, read preamble and raw block.
+
+        Kept free of NumPy work so get_waveforms can overlap this with
+        decoding on another thread.
+        """
+        # Ensure channel is enabled first (skipped when the cached
+        # display state already says it is)
+        if not self._channel_enabled.get(channel):
+            self.set_channel_enable(channel, True)
+
+        # Configure source, format and mode as one semicolon-chained
+        # message — one transport round-trip instead of three — and
+        # skip it entirely when the scope is already configured this
+        # way from the previous frame. BYTE keeps transfers small,
+        # WORD carries the ADC's full 12 bits in little-endian int16
+        if self._last_wav_config != (channel, data_width):
+            self.write_multi([
+                SCPICommands.WAVEFORM_SOURCE.format(f"CHAN{channel}"),
+                SCPICommands.WAVEFORM_FORMAT.format(
+                    "WORD" if data_width == 16 else "BYTE"),
+                SCPICommands.WAVEFORM_MODE.format("NORM"),
+            ])
+            self._last_wav_config = (channel, data_width)
+
+        # Set data range if specified; full-record reads program the
+        # range once the record length is known from the preamble
+        if points:
+            # Check current memory depth to ensure points is valid
+            try:
+                self._set_waveform_range(1, points)
+            except:
+                # If setting points fails, use default range
+                pass
+
+        # Get waveform preamble
+        preamble_str = self.query(SCPICommands.WAVEFORM_PREAMBLE)
+        preamble = parse_waveform_preamble(preamble_str)
+
+        # Get waveform data. Records beyond the per-request SCPI
+        # limit are fetched as WAV:STAR/WAV:STOP windows streamed
+        # straight into one pre-sized buffer; small records stay a
+        # single transfer. query_binary hands back a zero-copy view
+        # into the VISA read buffer, so each window is copied exactly
+        # once and peak memory is the record plus one in-flight window
+        # rather than the two full copies a chunk-list b"".join costs —
+        # pyvisa's read_binary_values(container=np.ndarray) would pay
+        # the same copy and give up the custom header/retry handling.
+        total_points = points if points else preamble.points
+        bytes_per_point = 2 if data_width == 16 else 1
+        if total_points > self._WAVEFORM_CHUNK_POINTS:
+            record = memoryview(bytearray(total_points * bytes_per_point))
+            offset = 0
+            for start in range(1, total_points + 1, self._WAVEFORM_CHUNK_POINTS):
+                stop = min(start + self._WAVEFORM_CHUNK_POINTS - 1, total_points)
+                self._set_waveform_range(start, stop)
+                window = self.query_binary(SCPICommands.WAVEFORM_DATA)
+                record[offset:offset + len(window)] = window
+                offset += len(window)
+            # Trim in case the scope delivered fewer points than asked
+            raw_data = record[:offset]
+            # Leave the full record programmed, not the final chunk
+            # window, so later reads don't inherit a sub-range
+            self._set_waveform_range(1, total_points)
+        else:
+            if not points:
+                # An earlier windowed read (or an acquisition change
+                # that reset the tracking) may have left WAV:STAR/STOP
+                # at a sub-range; program the full record explicitly.
+                # Elided when the tracked range already matches
+                self._set_waveform_range(1, total_points)
+            raw_data = self.query_binary(SCPICommands.WAVEFORM_DATA)
+
+        return preamble, raw_data
+
+    def _build_waveform(self, preamble: dict, raw_data: bytes) -> Dict[str, np.ndarray]:
+        """Decode a raw record into time/voltage arrays (CPU only, no bus traffic)."""
+        voltage_data = convert_raw_data_to_voltage(raw_data, preamble)
+
+        # Create time array with the same length as actual voltage data
+        actual_points = len(voltage_data)
+        time_data = np.arange(actual_points) * preamble.x_increment + preamble.x_origin
+
+        return {
+            'time': time_data,
+            'voltage': voltage_data,
+            'preamble': preamble
+        }
+
+    def get_waveforms(self, channels: List[int], points: Optional[int] = None,
+                      data_width: int = 8) -> Dict[int, Dict[str, np.ndarray]]:
+        """
+        Get waveform data for several channels in one call.
+
+        The VISA link is serial, but decoding is not: a dedicated I/O
+        thread streams channel after channel off the bus while the
+        calling thread converts each finished record to volts, so the
+        decode of channel N overlaps the transfer of channel N+1.
+        Cached channels (see get_waveform_data) skip the bus entirely.
+
+        Args:
+            channels: Channel numbers (1-4)
+            points: Number of points to acquire per channel
+            data_width: Bits per sample — 8 (BYTE) or 16 (WORD)
+
+        Returns:
+            Mapping of channel number to waveform dictionary
+        """
+        for channel in channels:
+            validate_channel(channel)
+        if data_width not in (8, 16):
+            raise ValueError("data_width must be 8 or 16")
+
+        results = {}
+        to_fetch = []
+        for channel in channels:
+            cached = self._wf_cache.get((channel, points, data_width))
+            if cached is not None:
+                results[channel] = dict(cached)
+            else:
+                to_fetch.append(channel)
+        if not to_fetch:
+            return results
+
+        records = queue.Queue()
+
+        def produce():
+            for channel in to_fetch:
+                try:
+                    records.put((channel,
+                                 self._fetch_raw_waveform(channel, points, data_width)))
+                except Exception as e:
+                    records.put((channel, e))
+
+        io_thread = threading.Thread(target=produce, daemon=True)
+        io_thread.start()
+
+        failure = None
+        for _ in to_fetch:
+            channel, payload = records.get()
+            if isinstance(payload, Exception):
+                if failure is None:
+                    failure = (channel, payload)
+                continue
+            preamble, raw_data = payload
+            waveform = self._build_waveform(preamble, raw_data)
+            self._wf_cache[(channel, points, data_width)] = waveform
+            results[channel] = dict(waveform)
+        io_thread.join()
+
+        if failure is not None:
+            channel, error = failure
+            raise DataError(f"Failed to get waveform data from channel {channel}: {str(error)}")
+        return results
+
+    def get_waveforms_soa(self, channels: List[int], points: Optional[int] = None,
+                          data_width: int = 8) -> MultiChannelWaveform:
+        """
+        Get several channels as one structure-of-arrays record.
+
+        Uses the same pipelined transfer as get_waveforms, then packs
+        the result into a MultiChannelWaveform: one shared time array
+        and a contiguous (channels, points) float32 voltage block.
+        Saves a full time-array copy per extra channel and lets
+        downstream code reduce across channels in single NumPy calls.
+
+        Args:
+            channels: Channel numbers (1-4)
+            points: Number of points to acquire per channel
+            data_width: Bits per sample — 8 (BYTE) or 16 (WORD)
+
+        Returns:
+            MultiChannelWaveform for the requested channels
+        """
+        waveforms = self.get_waveforms(channels, points, data_width)
+
+        # Records should be equal length within one acquisition; trim
+        # to the shortest defensively so the stack stays rectangular
+        n = min(len(waveforms[channel]['voltage']) for channel in channels)
+        voltages = np.empty((len(channels), n), dtype=np.float32)
+        for row, channel in enumerate(channels):
+            voltages[row] = waveforms[channel]['voltage'][:n]
+
+        return MultiChannelWaveform(
+            time=waveforms[channels[0]]['time'][:n],
+            voltages=voltages,
+            channels=tuple(channels),
+            preambles={channel: waveforms[channel]['preamble']
+                       for channel in channels},
+        )
+
+
     def save_waveform_csv(self, waveform_data: Dict[str, np.ndarray], filename: str, channel: int = 1) -> None:
         """Save waveform data to CSV file."""
         save_waveform_csv(waveform_data['time'], waveform_data['voltage'], filename, channel)
+
+    def save_waveform_npz(self, waveform_data: Dict[str, np.ndarray], filename: str) -> None:
+        """Save waveform data as compressed quantized samples (see utils.save_waveform_npz)."""
+        save_waveform_npz(waveform_data, filename)
     
     # Measurement methods
     def measure(self, measurement_type: str, channel: int) -> float:
@@ -476,9 +1220,10 @@ class RigolDHO914S:
         Args:
             measurement_type: Type of measurement (see MeasurementTypes class)
             channel: Channel number
-            
+
         Returns:
-            Measurement value
+            Measurement value, or None when the instrument reports the
+            9.9E37 invalid/overflow sentinel or the query fails
         """
         validate_channel(channel)
         
@@ -493,49 +1238,93 @@ class RigolDHO914S:
             # Return None for any measurement that fails
             return None
     
-    def get_voltage_measurements(self, channel: int) -> Dict[str, float]:
-        """Get common voltage measurements for a channel."""
+    def _get_measurements_batched(self, channel: int,
+                                  items: List[Tuple[str, str]],
+                                  template: Optional[str] = None) -> Dict[str, Optional[float]]:
+        """
+        Fetch several measurement items in one compound query.
+
+        One round-trip replaces one per metric; invalid readings (the
+        9.9E37 overflow sentinel) come back as None. Falls back to
+        per-item measure() calls if the compound query fails.
+
+        Args:
+            channel: Channel number
+            items: (result_key, measurement_type) pairs
+            template: Optional precompiled compound query with a {ch}
+                placeholder (see MeasurementTypes.*_BATCH_TEMPLATE);
+                skips rebuilding the message per call
+        """
+        try:
+            if template is not None:
+                response = self.query(template.format(ch=channel))
+                replies = [part.strip() for part in response.split(';')]
+            else:
+                replies = self.query_multi([
+                    SCPICommands.MEASURE_ITEM.format(meas_type, channel)
+                    for _, meas_type in items
+                ])
+            if len(replies) != len(items):
+                raise CommandError("Measurement reply count mismatch")
+        except CommandError:
+            return {name: self.measure(meas_type, channel)
+                    for name, meas_type in items}
+
         measurements = {}
-        
-        voltage_types = [
-            ('vpp', MeasurementTypes.VOLTAGE_PP),
-            ('vmax', MeasurementTypes.VOLTAGE_MAX),
-            ('vmin', MeasurementTypes.VOLTAGE_MIN),
-            ('vrms', MeasurementTypes.VOLTAGE_RMS),
-            ('vavg', MeasurementTypes.VOLTAGE_AVERAGE)
-        ]
-        
-        for name, meas_type in voltage_types:
+        for (name, _), reply in zip(items, replies):
             try:
-                measurements[name] = self.measure(meas_type, channel)
-            except:
+                value = float(reply)
+            except ValueError:
                 measurements[name] = None
-        
+                continue
+            measurements[name] = None if abs(value) > 1e10 else value
         return measurements
-    
+
+    def get_voltage_measurements(self, channel: int) -> Dict[str, float]:
+        """Get common voltage measurements for a channel."""
+        return self._get_measurements_batched(
+            channel, MeasurementTypes.VOLTAGE_ITEMS,
+            MeasurementTypes.VOLTAGE_BATCH_TEMPLATE)
+
     def get_time_measurements(self, channel: int) -> Dict[str, float]:
         """Get common time measurements for a channel."""
-        measurements = {}
-        
-        time_types = [
-            ('frequency', MeasurementTypes.FREQUENCY),
-            ('period', MeasurementTypes.PERIOD),
-            ('rise_time', MeasurementTypes.RISE_TIME),
-            ('fall_time', MeasurementTypes.FALL_TIME),
-            ('pulse_width', MeasurementTypes.PULSE_WIDTH_POSITIVE)
-        ]
-        
-        for name, meas_type in time_types:
-            try:
-                measurements[name] = self.measure(meas_type, channel)
-            except:
-                measurements[name] = None
-        
-        return measurements
+        return self._get_measurements_batched(
+            channel, MeasurementTypes.TIME_ITEMS,
+            MeasurementTypes.TIME_BATCH_TEMPLATE)
     
     # Utility methods
     def wait_for_operation_complete(self, timeout: float = 10.0) -> None:
-        """Wait for the oscilloscope to complete current operation."""
+        """
+        Wait for the oscilloscope to complete current operation.
+
+        Uses the *OPC event with a service request (SRQ) wait where the
+        interface supports it: the scope raises SRQ the instant the
+        operation finishes, instead of the 100 ms polling loop's
+        round-trips and average 50 ms overshoot. Interfaces without SRQ
+        (raw sockets) fall back to polling *OPC?.
+        """
+        if self._srq_supported is not False:
+            try:
+                if not self._srq_armed:
+                    # Route the Operation Complete bit of the event
+                    # status register onto the service request line
+                    self.write("*ESE 1")
+                    self.write("*SRE 32")
+                    self._srq_armed = True
+                self.write("*OPC")
+                self.instrument.wait_for_srq(int(timeout * 1000))
+                # Reading the event register clears the OPC bit so the
+                # next wait starts from a clean state
+                self.query("*ESR?")
+                return
+            except (AttributeError, NotImplementedError):
+                # Interface has no SRQ support; remember and poll
+                self._srq_supported = False
+            except pyvisa.VisaIOError as e:
+                if 'timeout' in str(e).lower():
+                    raise TimeoutError("Operation did not complete within timeout")
+                self._srq_supported = False
+
         start_time = time.time()
         while time.time() - start_time < timeout:
             if self.query("*OPC?") == "1":
@@ -544,7 +1333,59 @@ class RigolDHO914S:
         raise TimeoutError("Operation did not complete within timeout")
     
     def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status information."""
+        """
+        Get comprehensive system status information.
+
+        Results are cached for cache_ttl_ms (constructor argument,
+        default 500 ms): the ~17 SCPI queries behind this call are slow
+        on VXI-11, and settings change slowly relative to e.g. a
+        multi-screenshot burst. Values may therefore be up to one TTL
+        stale; call invalidate_cache() first when an exact snapshot is
+        required.
+        """
+        if self._status_cache is not None and self.cache_ttl_ms > 0:
+            cached_at, cached_status = self._status_cache
+            if (time.monotonic() - cached_at) * 1000 < self.cache_ttl_ms:
+                return dict(cached_status)
+
+        # One compound message replaces ~16 serial round-trips; wall
+        # time here is VISA turnarounds, not parsing
+        commands = [
+            SCPICommands.ERROR_QUERY,
+            SCPICommands.TRIGGER_STATUS,
+            SCPICommands.TIMEBASE_SCALE_QUERY,
+            SCPICommands.TIMEBASE_OFFSET_QUERY,
+        ]
+        for channel in range(1, 5):
+            commands.append(SCPICommands.CHANNEL_SCALE_QUERY.format(channel))
+            commands.append(SCPICommands.CHANNEL_OFFSET_QUERY.format(channel))
+            commands.append(SCPICommands.CHANNEL_COUPLING_QUERY.format(channel))
+
+        try:
+            replies = self.query_multi(commands)
+            if len(replies) != len(commands):
+                raise CommandError("Status reply count mismatch")
+
+            status = {
+                'identity': self.get_identity(),
+                'error': replies[0],
+                'trigger_status': replies[1],
+                'timebase_scale': float(replies[2]),
+                'timebase_offset': float(replies[3]),
+            }
+            for channel in range(1, 5):
+                base = 4 + (channel - 1) * 3
+                status[f'ch{channel}_scale'] = float(replies[base])
+                status[f'ch{channel}_offset'] = float(replies[base + 1])
+                status[f'ch{channel}_coupling'] = replies[base + 2]
+        except (CommandError, ValueError):
+            status = self._get_system_status_serial()
+
+        self._status_cache = (time.monotonic(), status)
+        return dict(status)
+
+    def _get_system_status_serial(self) -> Dict[str, Any]:
+        """Per-query status fallback used when the compound query fails."""
         status = {
             'identity': self.get_identity(),
             'error': self.get_error(),
@@ -552,7 +1393,7 @@ class RigolDHO914S:
             'timebase_scale': self.get_timebase_scale(),
             'timebase_offset': self.get_timebase_offset(),
         }
-        
+
         # Get channel information
         for channel in range(1, 5):
             try:
@@ -561,5 +1402,5 @@ class RigolDHO914S:
                 status[f'ch{channel}_coupling'] = self.get_channel_coupling(channel)
             except:
                 pass  # Channel may not be available
-        
+
         return status
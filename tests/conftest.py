@@ -0,0 +1,94 @@
+"""
+Shared fixtures for the Rigol DHO914S test suite.
+"""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """
+    Neutralize real delays for every test.
+
+    The driver sleeps in retry back-off and legacy polling paths; none
+    of that wall-clock time belongs in a mocked test run.
+    """
+    monkeypatch.setattr('rigol_dho914s.core.time.sleep', lambda *_: None,
+                        raising=False)
+
+
+@pytest.fixture
+def sleep_mock(monkeypatch):
+    """Variant of _no_sleep that yields the Mock for call assertions."""
+    mock = Mock()
+    monkeypatch.setattr('rigol_dho914s.core.time.sleep', mock, raising=False)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def rigol_idn():
+    """The canonical DHO914S *IDN? reply, built once per session."""
+    return "RIGOL TECHNOLOGIES,DHO914S,ABC123,01.01.00"
+
+
+# Mock doubles are pooled per process and reset between tests:
+# reset_mock() clears calls and configured values without reallocating
+# the child-mock tree that Mock() builds lazily on first use
+_MOCK_POOL = {}
+
+
+def _pooled_mock(name):
+    mock = _MOCK_POOL.get(name)
+    if mock is None:
+        mock = _MOCK_POOL[name] = Mock()
+    else:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture
+def mock_instrument(rigol_idn):
+    """A VISA instrument double that answers *IDN? as a DHO914S."""
+    instrument = _pooled_mock('instrument')
+    instrument.query.return_value = rigol_idn
+    return instrument
+
+
+@pytest.fixture
+def mock_rm(mock_instrument):
+    """A ResourceManager double whose open_resource yields the instrument."""
+    rm = _pooled_mock('resource_manager')
+    rm.open_resource.return_value = mock_instrument
+    return rm
+
+
+@pytest.fixture(scope="session")
+def sim_rm():
+    """
+    A pyvisa-sim ResourceManager backed by tests/dho914s_sim.yaml.
+
+    Built once per session; unlike the Mock fixtures it runs queries
+    through pyvisa's real parsing and termination handling. Tests using
+    it are skipped when pyvisa-sim is not installed.
+    """
+    pytest.importorskip('pyvisa_sim')
+    import pyvisa
+    yaml_path = os.path.join(os.path.dirname(__file__), 'dho914s_sim.yaml')
+    return pyvisa.ResourceManager(f"{yaml_path}@sim")
+
+
+@pytest.fixture
+def patched_pyvisa(monkeypatch, mock_rm):
+    """
+    Point the driver's pyvisa.ResourceManager at the mock manager.
+
+    Each test gets a fresh factory lambda, which also gives the driver's
+    process-wide resource-manager cache a fresh key, so no manager leaks
+    between tests.
+    """
+    monkeypatch.setattr('rigol_dho914s.core.pyvisa.ResourceManager',
+                        lambda: mock_rm)
+    return mock_rm
@@ -2,135 +2,158 @@
 Test connection functionality for Rigol DHO914S oscilloscope.
 """
 
-import sys
-import os
-import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
 from rigol_dho914s import RigolDHO914S, ConnectionError
 
+WRONG_IDN = "RIGOL TECHNOLOGIES,DHO804,ABC123,01.01.00"
+USB_ADDR = 'USB::0x1AB1::0x04CE::DHO9XXXX::INSTR'
+USB_ADDR_8 = 'USB::0x1AB1::0x04CE::DHO8XX::INSTR'
 
-class TestConnection(unittest.TestCase):
-    """Test oscilloscope connection functionality."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_instrument = Mock()
-        self.mock_resource_manager = Mock()
-    
-    @patch('rigol_dho914s.core.pyvisa')
-    def test_usb_connection_success(self, mock_pyvisa):
-        """Test successful USB connection."""
-        # Mock PyVISA components
-        mock_pyvisa.ResourceManager.return_value = self.mock_resource_manager
-        self.mock_resource_manager.open_resource.return_value = self.mock_instrument
-        self.mock_instrument.query.return_value = "RIGOL TECHNOLOGIES,DHO914S,ABC123,01.01.00"
-        
-        # Mock find_usb_devices
-        with patch('rigol_dho914s.core.find_usb_devices', return_value=['USB::0x1AB1::0x04CE::DHO9XXXX::INSTR']):
-            scope = RigolDHO914S(connection_type='usb')
-            
-            # Verify connection was established
-            self.mock_resource_manager.open_resource.assert_called()
-            self.mock_instrument.query.assert_called_with("*IDN?")
-            
-            scope.close()
-    
-    @patch('rigol_dho914s.core.pyvisa')
-    def test_ethernet_connection_success(self, mock_pyvisa):
-        """Test successful Ethernet connection."""
-        # Mock PyVISA components
-        mock_pyvisa.ResourceManager.return_value = self.mock_resource_manager
-        self.mock_resource_manager.open_resource.return_value = self.mock_instrument
-        self.mock_instrument.query.return_value = "RIGOL TECHNOLOGIES,DHO914S,ABC123,01.01.00"
-        
-        scope = RigolDHO914S(connection_type='ethernet', ip_address='192.168.1.100')
-        
-        # Verify connection was established with correct resource string
-        self.mock_resource_manager.open_resource.assert_called_with('TCPIP::192.168.1.100::INSTR')
-        self.mock_instrument.query.assert_called_with("*IDN?")
-        
+
+@pytest.mark.parametrize("kind,kwargs,idn,devices,expect", [
+    # Ethernet success (USB success is covered by test_usb_lifecycle)
+    ("ethernet", {"ip_address": "192.168.1.100"}, None, [], None),
+    # No USB device found
+    ("usb", {}, None, [], ConnectionError),
+    # Connected device is not a DHO914S
+    ("usb", {}, WRONG_IDN, [USB_ADDR_8], ConnectionError),
+])
+def test_connect(patched_pyvisa, mock_rm, mock_instrument, monkeypatch,
+                 kind, kwargs, idn, devices, expect):
+    """Connection success and failure paths for both transports."""
+    if idn is not None:
+        mock_instrument.query.return_value = idn
+    monkeypatch.setattr('rigol_dho914s.core.find_usb_devices',
+                        lambda: devices)
+
+    if expect is not None:
+        with pytest.raises(expect):
+            RigolDHO914S(connection_type=kind, **kwargs)
+        return
+
+    scope = RigolDHO914S(connection_type=kind, **kwargs)
+
+    mock_rm.open_resource.assert_called()
+    mock_instrument.query.assert_called_with("*IDN?")
+    if kind == 'ethernet':
+        # The default protocol prefers HiSLIP over VXI-11
+        mock_rm.open_resource.assert_called_with(
+            'TCPIP::192.168.1.100::hislip0::INSTR')
+
+    scope.close()
+
+
+@pytest.mark.parametrize("use_cm", [False, True])
+def test_usb_lifecycle(patched_pyvisa, mock_rm, mock_instrument, monkeypatch,
+                       use_cm):
+    """Connect over USB and close, explicitly or via the context manager."""
+    monkeypatch.setattr('rigol_dho914s.core.find_usb_devices',
+                        lambda: [USB_ADDR])
+
+    if use_cm:
+        with RigolDHO914S(connection_type='usb') as scope:
+            assert scope is not None
+    else:
+        scope = RigolDHO914S(connection_type='usb')
         scope.close()
-    
-    @patch('rigol_dho914s.core.pyvisa')
-    def test_connection_failure_no_device(self, mock_pyvisa):
-        """Test connection failure when no device is found."""
-        # Mock find_usb_devices to return empty list
-        with patch('rigol_dho914s.core.find_usb_devices', return_value=[]):
-            with self.assertRaises(ConnectionError):
-                RigolDHO914S(connection_type='usb')
-    
-    @patch('rigol_dho914s.core.pyvisa')
-    def test_connection_failure_wrong_device(self, mock_pyvisa):
-        """Test connection failure when connected device is not DHO914S."""
-        # Mock PyVISA components
-        mock_pyvisa.ResourceManager.return_value = self.mock_resource_manager
-        self.mock_resource_manager.open_resource.return_value = self.mock_instrument
-        self.mock_instrument.query.return_value = "RIGOL TECHNOLOGIES,DHO804,ABC123,01.01.00"
-        
-        with patch('rigol_dho914s.core.find_usb_devices', return_value=['USB::0x1AB1::0x04CE::DHO8XX::INSTR']):
-            with self.assertRaises(ConnectionError):
-                RigolDHO914S(connection_type='usb')
-    
-    def test_invalid_connection_type(self):
-        """Test invalid connection type raises error."""
-        with self.assertRaises(ValueError):
-            RigolDHO914S(connection_type='invalid')
-    
-    def test_ethernet_without_ip(self):
-        """Test Ethernet connection without IP address raises error."""
-        with self.assertRaises(ValueError):
-            RigolDHO914S(connection_type='ethernet')
-    
-    @patch('rigol_dho914s.core.pyvisa')
-    def test_context_manager(self, mock_pyvisa):
-        """Test context manager functionality."""
-        # Mock PyVISA components
-        mock_pyvisa.ResourceManager.return_value = self.mock_resource_manager
-        self.mock_resource_manager.open_resource.return_value = self.mock_instrument
-        self.mock_instrument.query.return_value = "RIGOL TECHNOLOGIES,DHO914S,ABC123,01.01.00"
-        
-        with patch('rigol_dho914s.core.find_usb_devices', return_value=['USB::0x1AB1::0x04CE::DHO9XXXX::INSTR']):
-            with RigolDHO914S(connection_type='usb') as scope:
-                self.assertIsNotNone(scope)
-            
-            # Verify close was called
-            self.mock_instrument.close.assert_called()
-            self.mock_resource_manager.close.assert_called()
-
-
-class TestConnectionUtilities(unittest.TestCase):
-    """Test connection utility functions."""
-    
-    @patch('rigol_dho914s.utils.pyvisa')
-    def test_find_usb_devices(self, mock_pyvisa):
-        """Test USB device discovery."""
-        from rigol_dho914s.utils import find_usb_devices
-        
-        # Mock ResourceManager
-        mock_rm = Mock()
-        mock_pyvisa.ResourceManager.return_value = mock_rm
-        mock_rm.list_resources.return_value = [
-            'USB::0x1AB1::0x04CE::DHO9XXXX::INSTR',
-            'USB::0x0957::0x1234::OTHER_DEVICE::INSTR',
-            'TCPIP::192.168.1.100::INSTR',
-            'USB::0x1AB1::0x04CE::DHO8XX::INSTR'
-        ]
-        
-        devices = find_usb_devices()
-        
-        # Should find only Rigol devices
-        expected_devices = [
-            'USB::0x1AB1::0x04CE::DHO9XXXX::INSTR',
-            'USB::0x1AB1::0x04CE::DHO8XX::INSTR'
-        ]
-        self.assertEqual(len(devices), 2)
-        for device in expected_devices:
-            self.assertIn(device, devices)
-
-
-if __name__ == '__main__':
-    unittest.main()
+
+    mock_rm.open_resource.assert_called()
+    mock_instrument.query.assert_called_with("*IDN?")
+    # Close lands on the instrument only; the resource manager is
+    # shared process-wide and must stay open
+    mock_instrument.close.assert_called_once()
+    mock_rm.close.assert_not_called()
+
+
+def test_idn_regex_is_module_level(rigol_idn):
+    """Identity validation reuses one compiled pattern."""
+    import rigol_dho914s.core as core
+
+    assert RigolDHO914S._IDN_RE is core._IDN_RE
+    assert core._IDN_RE.match(rigol_idn)
+    assert not core._IDN_RE.match(WRONG_IDN)
+
+
+def test_resource_manager_is_pooled(mock_rm, monkeypatch):
+    """Constructing two scopes builds the ResourceManager only once."""
+    factory = Mock(return_value=mock_rm)
+    monkeypatch.setattr('rigol_dho914s.core.pyvisa.ResourceManager', factory)
+    monkeypatch.setattr('rigol_dho914s.core.find_usb_devices',
+                        lambda: [USB_ADDR])
+
+    scope = RigolDHO914S(connection_type='usb')
+    scope.close()
+    scope = RigolDHO914S(connection_type='usb')
+    scope.close()
+
+    assert factory.call_count == 1
+
+
+def test_sim_backend_identity(sim_rm):
+    """Query the simulated instrument through pyvisa's real code path."""
+    instrument = sim_rm.open_resource('USB0::0x1AB1::0x04CE::DHO9XXXX::INSTR',
+                                      read_termination='\n',
+                                      write_termination='\n')
+    try:
+        assert instrument.query('*IDN?').startswith(
+            'RIGOL TECHNOLOGIES,DHO914S')
+    finally:
+        instrument.close()
+
+
+def test_find_usb_devices(mock_rm, monkeypatch):
+    """Test USB device discovery."""
+    from rigol_dho914s.utils import find_usb_devices
+
+    monkeypatch.setattr('pyvisa.ResourceManager', lambda: mock_rm)
+    mock_rm.list_resources.return_value = [
+        'USB::0x1AB1::0x04CE::DHO9XXXX::INSTR',
+        'USB::0x0957::0x1234::OTHER_DEVICE::INSTR',
+        'TCPIP::192.168.1.100::INSTR',
+        'USB::0x1AB1::0x04CE::DHO8XX::INSTR'
+    ]
+
+    # ttl=0 forces a fresh scan regardless of earlier cached results
+    devices = find_usb_devices(ttl=0)
+
+    # Should find only Rigol devices
+    expected_devices = [
+        'USB::0x1AB1::0x04CE::DHO9XXXX::INSTR',
+        'USB::0x1AB1::0x04CE::DHO8XX::INSTR'
+    ]
+    assert len(devices) == 2
+    for device in expected_devices:
+        assert device in devices
+
+
+@pytest.mark.parametrize("resource,matches", [
+    ('USB::0x1AB1::0x04CE::DHO9XXXX::INSTR', True),
+    ('USB0::0x1AB1::0x04CE::DHO9XXXX::INSTR', True),
+    ('usb1::0x1ab1::0x04ce::DHO9XXXX::instr', True),
+    ('USB::0x0957::0x1234::OTHER_DEVICE::INSTR', False),
+    ('TCPIP::192.168.1.100::INSTR', False),
+])
+def test_usb_filter_pattern(resource, matches):
+    """The compiled filter accepts Rigol VID resources in any casing."""
+    from rigol_dho914s.utils import _RIGOL_USB_RE
+
+    assert bool(_RIGOL_USB_RE.match(resource)) == matches
+
+
+@pytest.mark.parametrize("ttl,expected_scans", [(0, 2), (5, 1)])
+def test_find_usb_devices_cached(mock_rm, monkeypatch, ttl, expected_scans):
+    """Repeated discovery within the TTL reuses the cached scan."""
+    from rigol_dho914s.utils import find_usb_devices
+
+    monkeypatch.setattr('pyvisa.ResourceManager', lambda: mock_rm)
+    mock_rm.list_resources.return_value = [USB_ADDR]
+
+    find_usb_devices.cache_clear()
+    first = find_usb_devices(ttl=ttl)
+    second = find_usb_devices(ttl=ttl)
+
+    assert first == second == [USB_ADDR]
+    assert mock_rm.list_resources.call_count == expected_scans
@@ -0,0 +1,19 @@
+"""
+Argument-validation tests that need no instrument mocks.
+"""
+
+import pytest
+
+from rigol_dho914s import RigolDHO914S
+
+
+def test_invalid_connection_type():
+    """Test invalid connection type raises error."""
+    with pytest.raises(ValueError):
+        RigolDHO914S(connection_type='invalid')
+
+
+def test_ethernet_without_ip():
+    """Test Ethernet connection without IP address raises error."""
+    with pytest.raises(ValueError):
+        RigolDHO914S(connection_type='ethernet')